@@ -4,6 +4,7 @@ CRITICAL: proper service wiring, configuration validation, error handling.
 """
 from decimal import Decimal
 from typing import Optional
+import aiohttp
 from config.settings import Settings
 from utils.binance_client import BinanceClient
 from .services.market_data_service import MarketDataService
@@ -31,8 +32,12 @@ class TradingBotFactory:
 
         logger.info("TradingBotFactory initialized")
 
-    def create_trading_engine(self, settings: Settings) -> TradingEngine:
-        """Create trading engine with all dependencies"""
+    def create_trading_engine(self, settings: Settings,
+                              http_session: Optional[aiohttp.ClientSession] = None) -> TradingEngine:
+        """
+        Create trading engine with all dependencies.
+        http_session, when given, is shared by the Binance and Telegram clients.
+        """
         try:
             logger.info("Creating trading engine with dependency injection")
 
@@ -40,7 +45,8 @@ class TradingBotFactory:
             self._validate_settings(settings)
 
             # Create HTTP client
-            binance_client = self._create_binance_client(settings)
+            binance_client = self._create_binance_client(
+                settings, http_session)
 
             # Create services in dependency order
             market_data_service = self._create_market_data_service(
@@ -50,7 +56,8 @@ class TradingBotFactory:
                 settings, portfolio_service)
             order_service = self._create_order_service(
                 binance_client, market_data_service)
-            notification_service = self._create_notification_service(settings)
+            notification_service = self._create_notification_service(
+                settings, http_session)
 
             # Create trading engine
             trading_engine = TradingEngine(
@@ -98,7 +105,8 @@ class TradingBotFactory:
 
         logger.debug("Settings validation passed")
 
-    def _create_binance_client(self, settings: Settings) -> BinanceClient:
+    def _create_binance_client(self, settings: Settings,
+                               http_session: Optional[aiohttp.ClientSession] = None) -> BinanceClient:
         """Create and configure Binance client"""
         logger.debug("Creating Binance client")
 
@@ -107,7 +115,8 @@ class TradingBotFactory:
                 api_key=settings.binance.api_key,
                 api_secret=settings.binance.api_secret,
                 testnet=settings.binance.testnet,
-                rate_limit_per_minute=settings.binance.rate_limit_per_minute
+                rate_limit_per_minute=settings.binance.rate_limit_per_minute,
+                session=http_session
             )
             logger.info(
                 f"Binance client created (testnet: {settings.binance.testnet})")
@@ -160,7 +169,8 @@ class TradingBotFactory:
 
         return self._order_service
 
-    def _create_notification_service(self, settings: Settings) -> NotificationService:
+    def _create_notification_service(self, settings: Settings,
+                                     http_session: Optional[aiohttp.ClientSession] = None) -> NotificationService:
         """Create notification service"""
         logger.debug("Creating NotificationService")
 
@@ -172,7 +182,8 @@ class TradingBotFactory:
 
             self._notification_service = NotificationService(
                 telegram_token=telegram_token,
-                chat_id=chat_id
+                chat_id=chat_id,
+                http_session=http_session
             )
             logger.info("NotificationService created")
 
@@ -239,9 +250,10 @@ class TradingBotFactory:
 trading_factory = TradingBotFactory()
 
 
-def create_trading_engine(settings: Settings) -> TradingEngine:
+def create_trading_engine(settings: Settings,
+                          http_session: Optional[aiohttp.ClientSession] = None) -> TradingEngine:
     """Convenience function to create trading engine"""
-    return trading_factory.create_trading_engine(settings)
+    return trading_factory.create_trading_engine(settings, http_session)
 
 
 def create_strategy_engine(settings: Settings, strategy_name: str) -> TradingEngine:
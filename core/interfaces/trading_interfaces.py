@@ -4,9 +4,10 @@ CRITICAL: all financial operations ONLY through Decimal!
 """
 from abc import ABC, abstractmethod
 from decimal import Decimal
-from typing import Dict, Any, List, Optional
+from typing import Dict, Optional, Tuple
 from dataclasses import dataclass
 from enum import Enum
+import numpy as np
 
 
 class OrderSide(Enum):
@@ -22,7 +23,7 @@ class OrderStatus(Enum):
     REJECTED = "rejected"
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class OrderResult:
     """Order execution result"""
     status: OrderStatus
@@ -33,7 +34,7 @@ class OrderResult:
     profit: Optional[Decimal] = None
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class RiskCheckResult:
     """Risk validation result"""
     approved: bool
@@ -41,7 +42,7 @@ class RiskCheckResult:
     risk_score: Decimal = Decimal('0')
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class PositionData:
     """Position data"""
     symbol: str
@@ -59,14 +60,16 @@ class IMarketDataService(ABC):
         pass
 
     @abstractmethod
-    async def get_klines(self, symbol: str, interval: str, limit: int) -> List[Dict[str, Any]]:
-        """Get klines for analysis"""
+    async def get_klines(self, symbol: str, interval: str, limit: int) -> Dict[str, np.ndarray]:
+        """Get klines for analysis as column arrays keyed by field (open, high, low, close, volume, ...)"""
         pass
 
 
 class IRiskService(ABC):
     """Interface for risk management"""
 
+    __slots__ = ()
+
     @abstractmethod
     async def validate_buy_order(self, symbol: str, quantity: Decimal, price: Decimal) -> RiskCheckResult:
         """Validate buy order"""
@@ -104,6 +107,8 @@ class INotificationService(ABC):
 class IPortfolioService(ABC):
     """Interface for portfolio management"""
 
+    __slots__ = ()
+
     @abstractmethod
     async def get_position(self, symbol: str) -> Optional[PositionData]:
         """Get position by symbol"""
@@ -118,3 +123,8 @@ class IPortfolioService(ABC):
     async def has_position(self, symbol: str) -> bool:
         """Check if position exists"""
         pass
+
+    @abstractmethod
+    async def get_snapshot(self, symbol: str) -> Tuple[Decimal, Optional[PositionData]]:
+        """Get account balance and position for symbol from one consistent state"""
+        pass
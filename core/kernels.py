@@ -0,0 +1,29 @@
+# core/kernels.py
+"""
+Numeric kernels for the trading core.
+Compiled with Numba when available (see utils.jit); explicit signatures
+make compilation happen at import time instead of on the first call.
+"""
+import numpy as np
+
+from utils.jit import njit
+
+
+@njit("UniTuple(float64, 4)(float64[::1], float64[::1], float64[::1], float64[::1])", cache=True)
+def ohlcv_reduce(open_: np.ndarray, high: np.ndarray, low: np.ndarray, volume: np.ndarray):
+    """
+    Reduce OHLCV columns in one pass.
+
+    Returns:
+        (high, low, volume, first_open)
+    """
+    max_high = high[0]
+    min_low = low[0]
+    total_volume = 0.0
+    for i in range(high.shape[0]):
+        if high[i] > max_high:
+            max_high = high[i]
+        if low[i] < min_low:
+            min_low = low[i]
+        total_volume += volume[i]
+    return max_high, min_low, total_volume, open_[0]
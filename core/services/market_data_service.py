@@ -3,13 +3,21 @@ Market Data Service - retrieves market data from exchange.
 CRITICAL: all prices as Decimal, proper error handling.
 """
 from decimal import Decimal
-from typing import List, Dict, Any
+from typing import Dict
+import numpy as np
 from ..interfaces.trading_interfaces import IMarketDataService
 from ..exceptions.trading_exceptions import MarketDataError
+from utils.decimal_utils import to_decimal
 from utils.logger import get_trading_logger
 
 logger = get_trading_logger()
 
+# Binance kline fields in response order
+KLINE_COLUMNS = (
+    'open_time', 'open', 'high', 'low', 'close', 'volume', 'close_time',
+    'quote_volume', 'trades_count', 'taker_buy_base_volume', 'taker_buy_quote_volume'
+)
+
 
 class MarketDataService(IMarketDataService):
     """Market data service implementation"""
@@ -29,7 +37,7 @@ class MarketDataService(IMarketDataService):
                 raise MarketDataError(
                     f"No price data received for {symbol}", symbol=symbol, data_type="current_price")
 
-            price = Decimal(str(price_data['price']))
+            price = to_decimal(price_data['price'])
             logger.debug(f"Current price for {symbol}: {price}")
             return price
 
@@ -40,8 +48,8 @@ class MarketDataService(IMarketDataService):
             raise MarketDataError(
                 f"Price fetch failed: {str(e)}", symbol=symbol, data_type="current_price")
 
-    async def get_klines(self, symbol: str, interval: str, limit: int) -> List[Dict[str, Any]]:
-        """Get klines for analysis"""
+    async def get_klines(self, symbol: str, interval: str, limit: int) -> Dict[str, np.ndarray]:
+        """Get klines for analysis as column arrays (see KLINE_COLUMNS)"""
         try:
             logger.debug(
                 f"Fetching klines for {symbol}, interval: {interval}, limit: {limit}")
@@ -57,25 +65,17 @@ class MarketDataService(IMarketDataService):
                 raise MarketDataError(
                     f"No klines data received for {symbol}", symbol=symbol, data_type="klines")
 
-            # Convert to proper format with Decimal values
-            processed_klines = []
-            for kline in klines:
-                processed_klines.append({
-                    'open_time': kline[0],
-                    'open': Decimal(str(kline[1])),
-                    'high': Decimal(str(kline[2])),
-                    'low': Decimal(str(kline[3])),
-                    'close': Decimal(str(kline[4])),
-                    'volume': Decimal(str(kline[5])),
-                    'close_time': kline[6],
-                    'quote_volume': Decimal(str(kline[7])),
-                    'trades_count': kline[8],
-                    'taker_buy_base_volume': Decimal(str(kline[9])),
-                    'taker_buy_quote_volume': Decimal(str(kline[10]))
-                })
+            # Column-oriented (SoA) float arrays - klines feed analysis only;
+            # order prices stay Decimal via get_current_price
+            columns = np.array([kline[:11] for kline in klines],
+                               dtype=np.float64).T.copy()
+            processed_klines = {
+                name: columns[index] for index, name in enumerate(KLINE_COLUMNS)}
+            for name in ('open_time', 'close_time', 'trades_count'):
+                processed_klines[name] = processed_klines[name].astype(np.int64)
 
             logger.debug(
-                f"Retrieved {len(processed_klines)} klines for {symbol}")
+                f"Retrieved {len(klines)} klines for {symbol}")
             return processed_klines
 
         except MarketDataError:
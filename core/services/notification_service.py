@@ -2,21 +2,29 @@
 Notification Service - sends trade alerts and notifications.
 CRITICAL: reliable delivery, proper error handling, non-blocking operations.
 """
+from datetime import datetime
 from decimal import Decimal
 from typing import Optional
 from ..interfaces.trading_interfaces import INotificationService, OrderSide
 from ..exceptions.trading_exceptions import TradingError
 from utils.logger import get_trading_logger
 
+try:
+    import aiohttp
+except ImportError:  # Telegram notifications are disabled without aiohttp
+    aiohttp = None
+
 logger = get_trading_logger()
 
 
 class NotificationService(INotificationService):
     """Notification service implementation"""
 
-    def __init__(self, telegram_token: Optional[str] = None, chat_id: Optional[str] = None):
+    def __init__(self, telegram_token: Optional[str] = None, chat_id: Optional[str] = None,
+                 http_session: Optional["aiohttp.ClientSession"] = None):
         self.telegram_token = telegram_token
         self.chat_id = chat_id
+        self.http_session = http_session  # Shared session, owned by the caller
         self.enabled = bool(telegram_token and chat_id)
 
         if self.enabled:
@@ -120,9 +128,11 @@ class NotificationService(INotificationService):
 
     async def _send_telegram_message(self, message: str) -> bool:
         """Send message via Telegram Bot API"""
-        try:
-            import aiohttp
+        if aiohttp is None:
+            logger.error("aiohttp not available for Telegram notifications")
+            return False
 
+        try:
             url = f"https://api.telegram.org/bot{self.telegram_token}/sendMessage"
 
             payload = {
@@ -132,30 +142,32 @@ class NotificationService(INotificationService):
                 "disable_web_page_preview": True
             }
 
+            if self.http_session is not None and not self.http_session.closed:
+                return await self._post_telegram(self.http_session, url, payload)
+
             async with aiohttp.ClientSession() as session:
-                async with session.post(url, json=payload, timeout=10) as response:
-                    if response.status == 200:
-                        result = await response.json()
-                        return result.get("ok", False)
-                    else:
-                        logger.error(f"Telegram API error: {response.status}")
-                        return False
-
-        except ImportError:
-            logger.error("aiohttp not available for Telegram notifications")
-            return False
+                return await self._post_telegram(session, url, payload)
+
         except Exception as e:
             logger.error(f"Telegram message send failed: {e}")
             return False
 
+    async def _post_telegram(self, session: "aiohttp.ClientSession", url: str, payload: dict) -> bool:
+        """POST payload to Telegram and report whether it was accepted"""
+        async with session.post(url, json=payload, timeout=10) as response:
+            if response.status == 200:
+                result = await response.json()
+                return result.get("ok", False)
+            else:
+                logger.error(f"Telegram API error: {response.status}")
+                return False
+
     def _get_current_time(self) -> str:
         """Get current time formatted for notifications"""
-        from datetime import datetime
         return datetime.utcnow().strftime("%Y-%m-%d %H:%M:%S UTC")
 
     def _get_current_date(self) -> str:
         """Get current date formatted for notifications"""
-        from datetime import datetime
         return datetime.utcnow().strftime("%Y-%m-%d")
 
     def set_telegram_config(self, token: str, chat_id: str):
@@ -3,13 +3,44 @@ Order Service - executes trading orders on exchange.
 CRITICAL: atomic operations with proper rollback, all amounts as Decimal.
 """
 from decimal import Decimal
-from typing import Optional
+from typing import Optional, Tuple
 from ..interfaces.trading_interfaces import IOrderService, OrderResult, OrderStatus, IMarketDataService
 from ..exceptions.trading_exceptions import OrderExecutionError, ExchangeConnectionError
+from utils.decimal_utils import to_decimal
 from utils.logger import get_trading_logger
 
 logger = get_trading_logger()
 
+_DEC_ZERO = Decimal('0')
+
+
+def _summarize_fills(order_response: dict, quantity: Decimal, price: Decimal) -> Tuple[Decimal, Decimal]:
+    """
+    Summarize order fills in one pass.
+
+    Returns:
+        (executed_qty, avg_price) - avg_price is the volume-weighted fill price;
+        falls back to the requested quantity/price when the exchange omits them
+    """
+    fills = order_response.get('fills', ())
+
+    # Exact Decimal sums - the quantity is what is later sold and the
+    # price feeds P&L and the daily loss limit
+    filled_qty = _DEC_ZERO
+    notional = _DEC_ZERO
+    for fill in fills:
+        fill_qty = to_decimal(fill['qty'])
+        filled_qty += fill_qty
+        notional += fill_qty * to_decimal(fill['price'])
+    avg_price = notional / filled_qty if filled_qty > 0 else _DEC_ZERO
+
+    executed_qty = order_response.get('executedQty')
+    executed_qty = to_decimal(executed_qty) if executed_qty is not None else (
+        filled_qty if filled_qty > 0 else quantity)
+    if filled_qty <= 0:
+        avg_price = price
+    return executed_qty, avg_price
+
 
 class OrderService(IOrderService):
     """Order execution service implementation"""
@@ -23,7 +54,7 @@ class OrderService(IOrderService):
         """Execute buy order on exchange"""
         try:
             logger.info(
-                f"Executing buy order: {symbol} qty={quantity} price={price}")
+                "Executing buy order: %s qty=%s price=%s", symbol, quantity, price)
 
             # Validate inputs
             if quantity <= 0:
@@ -38,20 +69,20 @@ class OrderService(IOrderService):
             # Validate price is reasonable (within 5% of market price)
             if price_diff_pct > 5:
                 logger.warning(
-                    f"Price {price} differs {price_diff_pct:.2f}% from market price {current_price}")
+                    "Price %s differs %.2f%% from market price %s",
+                    price, price_diff_pct, current_price)
 
             # Execute order on exchange
             order_response = await self._execute_market_buy(symbol, quantity)
 
             if order_response and order_response.get('status') == 'FILLED':
-                executed_qty = Decimal(
-                    str(order_response.get('executedQty', quantity)))
-                executed_price = Decimal(
-                    str(order_response.get('fills', [{}])[0].get('price', price)))
+                executed_qty, executed_price = _summarize_fills(
+                    order_response, quantity, price)
                 order_id = str(order_response.get('orderId', ''))
 
                 logger.info(
-                    f"Buy order executed successfully: {symbol} qty={executed_qty} price={executed_price}")
+                    "Buy order executed successfully: %s qty=%s price=%s",
+                    symbol, executed_qty, executed_price)
                 return OrderResult(
                     status=OrderStatus.SUCCESS,
                     order_id=order_id,
@@ -73,14 +104,14 @@ class OrderService(IOrderService):
         except OrderExecutionError:
             raise
         except Exception as e:
-            logger.error(f"Buy order execution failed for {symbol}: {e}")
+            logger.exception("Buy order execution failed for %s", symbol)
             raise OrderExecutionError(f"Buy order failed: {str(e)}")
 
     async def execute_sell_order(self, symbol: str, quantity: Decimal, price: Decimal) -> OrderResult:
         """Execute sell order on exchange"""
         try:
             logger.info(
-                f"Executing sell order: {symbol} qty={quantity} price={price}")
+                "Executing sell order: %s qty=%s price=%s", symbol, quantity, price)
 
             # Validate inputs
             if quantity <= 0:
@@ -95,20 +126,20 @@ class OrderService(IOrderService):
             # Validate price is reasonable (within 5% of market price)
             if price_diff_pct > 5:
                 logger.warning(
-                    f"Price {price} differs {price_diff_pct:.2f}% from market price {current_price}")
+                    "Price %s differs %.2f%% from market price %s",
+                    price, price_diff_pct, current_price)
 
             # Execute order on exchange
             order_response = await self._execute_market_sell(symbol, quantity)
 
             if order_response and order_response.get('status') == 'FILLED':
-                executed_qty = Decimal(
-                    str(order_response.get('executedQty', quantity)))
-                executed_price = Decimal(
-                    str(order_response.get('fills', [{}])[0].get('price', price)))
+                executed_qty, executed_price = _summarize_fills(
+                    order_response, quantity, price)
                 order_id = str(order_response.get('orderId', ''))
 
                 logger.info(
-                    f"Sell order executed successfully: {symbol} qty={executed_qty} price={executed_price}")
+                    "Sell order executed successfully: %s qty=%s price=%s",
+                    symbol, executed_qty, executed_price)
                 return OrderResult(
                     status=OrderStatus.SUCCESS,
                     order_id=order_id,
@@ -130,7 +161,7 @@ class OrderService(IOrderService):
         except OrderExecutionError:
             raise
         except Exception as e:
-            logger.error(f"Sell order execution failed for {symbol}: {e}")
+            logger.exception("Sell order execution failed for %s", symbol)
             raise OrderExecutionError(f"Sell order failed: {str(e)}")
 
     async def _execute_market_buy(self, symbol: str, quantity: Decimal) -> dict:
@@ -146,12 +177,12 @@ class OrderService(IOrderService):
                 'quantity': qty_str
             }
 
-            logger.debug(f"Sending market buy order: {order_params}")
+            logger.debug("Sending market buy order: %s", order_params)
             response = await self.client.create_order(**order_params)
             return response
 
         except Exception as e:
-            logger.error(f"Market buy execution failed: {e}")
+            logger.error("Market buy execution failed: %s", e)
             raise ExchangeConnectionError(f"Market buy failed: {str(e)}")
 
     async def _execute_market_sell(self, symbol: str, quantity: Decimal) -> dict:
@@ -167,12 +198,12 @@ class OrderService(IOrderService):
                 'quantity': qty_str
             }
 
-            logger.debug(f"Sending market sell order: {order_params}")
+            logger.debug("Sending market sell order: %s", order_params)
             response = await self.client.create_order(**order_params)
             return response
 
         except Exception as e:
-            logger.error(f"Market sell execution failed: {e}")
+            logger.error("Market sell execution failed: %s", e)
             raise ExchangeConnectionError(f"Market sell failed: {str(e)}")
 
     async def close(self):
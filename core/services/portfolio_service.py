@@ -2,24 +2,41 @@
 Portfolio Service - manages portfolio positions and account balance.
 CRITICAL: atomic operations, accurate balance tracking, Decimal precision.
 """
+import asyncio
+import time
 from decimal import Decimal
-from typing import Optional, Dict
+from types import MappingProxyType
+from typing import Final, Optional, Dict, Mapping, Sequence, Tuple
 from ..interfaces.trading_interfaces import IPortfolioService, PositionData
 from ..exceptions.trading_exceptions import PositionNotFoundError, ExchangeConnectionError
+from utils.binance_client import BinanceClient
+from utils.decimal_utils import to_decimal
 from utils.logger import get_trading_logger
 
 logger = get_trading_logger()
 
+_ZERO = Decimal('0.0')
+
 
 class PortfolioService(IPortfolioService):
     """Portfolio management service implementation"""
 
-    def __init__(self, binance_client):
-        self.client = binance_client
+    __slots__ = ('client', '_position_cache', '_positions_view', '_balance_by_asset',
+                 '_snapshot_complete', '_cache_timestamp', '_cache_ttl', '_refresh_lock')
+
+    def __init__(self, binance_client: BinanceClient) -> None:
+        self.client: Final[BinanceClient] = binance_client
         self._position_cache: Dict[str, PositionData] = {}
-        self._balance_cache: Optional[Decimal] = None
+        # Live read-only view handed out by get_all_positions
+        self._positions_view = MappingProxyType(self._position_cache)
+        # Free amount per asset from the last account snapshot
+        self._balance_by_asset: Optional[Dict[str, Decimal]] = None
+        # True once a full account snapshot has been loaded
+        self._snapshot_complete: bool = False
         self._cache_timestamp = 0
         self._cache_ttl = 30  # 30 seconds cache TTL
+        # Single-flight guard so concurrent callers share one account fetch
+        self._refresh_lock = asyncio.Lock()
 
         logger.info("PortfolioService initialized")
 
@@ -28,10 +45,11 @@ class PortfolioService(IPortfolioService):
         try:
             logger.debug(f"Getting position for {symbol}")
 
-            # Check cache first
-            if self._is_cache_valid() and symbol in self._position_cache:
+            # Check cache first - a loaded snapshot is authoritative for
+            # symbols it does not contain too (negative cache)
+            if self._is_cache_valid() and self._snapshot_complete:
                 logger.debug(f"Position cache hit for {symbol}")
-                return self._position_cache[symbol]
+                return self._position_cache.get(symbol)
 
             # Fetch from exchange
             await self._refresh_positions()
@@ -54,27 +72,13 @@ class PortfolioService(IPortfolioService):
         try:
             logger.debug("Getting account balance")
 
-            # Check cache first
-            if self._is_cache_valid() and self._balance_cache is not None:
-                logger.debug(f"Balance cache hit: {self._balance_cache}")
-                return self._balance_cache
-
-            # Fetch from exchange
-            account_info = await self.client.get_account()
-
-            if not account_info or 'balances' not in account_info:
-                raise ExchangeConnectionError("Invalid account info received")
-
-            # Find USDT balance
-            usdt_balance = Decimal('0.0')
-            for balance in account_info['balances']:
-                if balance['asset'] == 'USDT':
-                    usdt_balance = Decimal(str(balance['free']))
-                    break
+            # Positions and balances come from the same account snapshot
+            if not self._is_cache_valid() or self._balance_by_asset is None:
+                await self._refresh_positions()
+            else:
+                logger.debug("Balance cache hit")
 
-            # Update cache
-            self._balance_cache = usdt_balance
-            self._update_cache_timestamp()
+            usdt_balance = self._balance_by_asset.get('USDT', _ZERO)
 
             logger.debug(f"Account balance: {usdt_balance} USDT")
             return usdt_balance
@@ -83,6 +87,23 @@ class PortfolioService(IPortfolioService):
             logger.error(f"Failed to get account balance: {e}")
             raise ExchangeConnectionError(f"Balance fetch failed: {str(e)}")
 
+    async def get_snapshot(self, symbol: str) -> Tuple[Decimal, Optional[PositionData]]:
+        """Get USDT balance and position for symbol from a single cache check"""
+        try:
+            if not self._is_cache_valid() or not self._snapshot_complete:
+                await self._refresh_positions()
+
+            # Read both values without awaiting in between so they match
+            balance = self._balance_by_asset.get('USDT', _ZERO)
+            position = self._position_cache.get(symbol)
+            logger.debug(
+                f"Snapshot for {symbol}: balance={balance} position={position is not None}")
+            return balance, position
+
+        except Exception as e:
+            logger.error(f"Failed to get snapshot for {symbol}: {e}")
+            raise ExchangeConnectionError(f"Snapshot fetch failed: {str(e)}")
+
     async def has_position(self, symbol: str) -> bool:
         """Check if position exists"""
         try:
@@ -95,19 +116,24 @@ class PortfolioService(IPortfolioService):
             logger.error(f"Failed to check position for {symbol}: {e}")
             return False
 
-    async def get_all_positions(self) -> Dict[str, PositionData]:
-        """Get all open positions"""
+    async def get_all_positions(self) -> Mapping[str, PositionData]:
+        """
+        Get all open positions.
+
+        Returns a read-only live view of the cache; it reflects later
+        refreshes, so copy it if a stable snapshot is needed across awaits.
+        """
         try:
             logger.debug("Getting all positions")
 
             # Check cache first
-            if self._is_cache_valid():
+            if self._is_cache_valid() and self._snapshot_complete:
                 logger.debug("All positions cache hit")
-                return self._position_cache.copy()
+                return self._positions_view
 
             # Refresh from exchange
             await self._refresh_positions()
-            return self._position_cache.copy()
+            return self._positions_view
 
         except Exception as e:
             logger.error(f"Failed to get all positions: {e}")
@@ -122,17 +148,25 @@ class PortfolioService(IPortfolioService):
             balance = await self.get_account_balance()
             total_value = balance
 
-            # Add value of all positions
-            positions = await self.get_all_positions()
-            for symbol, position in positions.items():
-                # Get current price for position valuation
-                try:
-                    current_price = await self._get_current_price(symbol)
-                    position_value = position.quantity * current_price
-                    total_value += position_value
-                    logger.debug(f"Position {symbol} value: {position_value}")
-                except Exception as e:
-                    logger.warning(f"Failed to get price for {symbol}: {e}")
+            # Snapshot positions, then fetch all prices concurrently
+            positions = list((await self.get_all_positions()).values())
+            prices = await asyncio.gather(
+                *(self._get_current_price(position.symbol) for position in positions),
+                return_exceptions=True)
+
+            quantities = []
+            valued_prices = []
+            for position, price in zip(positions, prices):
+                # BaseException: a cancelled fetch comes back as CancelledError
+                if isinstance(price, BaseException):
+                    logger.warning(
+                        f"Failed to get price for {position.symbol}: {price}")
+                    continue
+                quantities.append(position.quantity)
+                valued_prices.append(price)
+
+            total_value += self._sum_position_values(
+                quantities, valued_prices)
 
             logger.info(f"Total portfolio value: {total_value} USDT")
             return total_value
@@ -142,8 +176,21 @@ class PortfolioService(IPortfolioService):
             raise ExchangeConnectionError(
                 f"Portfolio value calculation failed: {str(e)}")
 
-    async def _refresh_positions(self):
-        """Refresh positions from exchange"""
+    @staticmethod
+    def _sum_position_values(quantities: Sequence[Decimal], prices: Sequence[Decimal]) -> Decimal:
+        """Sum quantity * price over positions, exactly in Decimal"""
+        return sum((q * p for q, p in zip(quantities, prices)), _ZERO)
+
+    async def _refresh_positions(self) -> None:
+        """Refresh positions and balances from exchange"""
+        async with self._refresh_lock:
+            # Another caller may have refreshed while we waited for the lock
+            if self._is_cache_valid() and self._snapshot_complete:
+                return
+            await self._fetch_account_snapshot()
+
+    async def _fetch_account_snapshot(self) -> None:
+        """Fetch account info and rebuild position and balance caches"""
         try:
             logger.debug("Refreshing positions from exchange")
 
@@ -153,13 +200,15 @@ class PortfolioService(IPortfolioService):
 
             # Clear cache
             self._position_cache.clear()
+            balance_by_asset = {}
 
             # Process balances
             for balance in account_info['balances']:
                 asset = balance['asset']
-                free_amount = Decimal(str(balance['free']))
-                locked_amount = Decimal(str(balance['locked']))
+                free_amount = to_decimal(balance['free'])
+                locked_amount = to_decimal(balance['locked'])
                 total_amount = free_amount + locked_amount
+                balance_by_asset[asset] = free_amount
 
                 # Only track positions with significant amounts (> 0.001)
                 if total_amount > Decimal('0.001') and asset != 'USDT':
@@ -180,6 +229,8 @@ class PortfolioService(IPortfolioService):
                     logger.debug(
                         f"Cached position: {symbol} qty={total_amount}")
 
+            self._snapshot_complete = True
+            self._balance_by_asset = balance_by_asset
             self._update_cache_timestamp()
             logger.debug(f"Refreshed {len(self._position_cache)} positions")
 
@@ -192,7 +243,7 @@ class PortfolioService(IPortfolioService):
         try:
             ticker = await self.client.get_ticker_price(symbol=symbol)
             if ticker and 'price' in ticker:
-                return Decimal(str(ticker['price']))
+                return to_decimal(ticker['price'])
             else:
                 raise ExchangeConnectionError(f"No price data for {symbol}")
         except Exception as e:
@@ -201,22 +252,21 @@ class PortfolioService(IPortfolioService):
 
     def _is_cache_valid(self) -> bool:
         """Check if cache is still valid"""
-        import time
         return (time.time() - self._cache_timestamp) < self._cache_ttl
 
-    def _update_cache_timestamp(self):
+    def _update_cache_timestamp(self) -> None:
         """Update cache timestamp"""
-        import time
         self._cache_timestamp = time.time()
 
-    def invalidate_cache(self):
+    def invalidate_cache(self) -> None:
         """Manually invalidate cache"""
         self._position_cache.clear()
-        self._balance_cache = None
+        self._balance_by_asset = None
+        self._snapshot_complete = False
         self._cache_timestamp = 0
         logger.debug("Portfolio cache invalidated")
 
-    def set_cache_ttl(self, ttl_seconds: int):
+    def set_cache_ttl(self, ttl_seconds: int) -> None:
         """Set cache time-to-live"""
         self._cache_ttl = ttl_seconds
         logger.info(f"Cache TTL set to {ttl_seconds} seconds")
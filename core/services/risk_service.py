@@ -1,45 +1,115 @@
 """
 Risk Service - validates trading operations against risk parameters.
-CRITICAL: all financial calculations with Decimal, comprehensive validation.
+CRITICAL: all financial calculations exact, comprehensive validation.
+
+Amounts are held internally as integers scaled to exchange precision (1e-8),
+so hot-path comparisons are plain int operations. Decimal is used only at the
+API boundary (constructor arguments, RiskCheckResult, log messages).
 """
 from decimal import Decimal
-from typing import Optional
-from ..interfaces.trading_interfaces import IRiskService, RiskCheckResult
+from typing import Final, Optional
+from ..interfaces.trading_interfaces import IRiskService, IPortfolioService, RiskCheckResult
 from ..exceptions.trading_exceptions import RiskValidationError, InsufficientBalanceError
 from utils.logger import get_trading_logger
 
 logger = get_trading_logger()
 
+# Binance amounts carry at most 8 decimal places
+SCALE = 10 ** 8
+_SCALE_SQ = SCALE * SCALE
+_D_SCALE = Decimal(SCALE)
+
+
+def _to_scaled(value: Decimal) -> int:
+    """Convert Decimal amount to integer units of 1e-8"""
+    return int((value * _D_SCALE).to_integral_value())
+
+
+def _from_scaled(value: int, scale: int = SCALE) -> Decimal:
+    """Convert scaled integer back to Decimal (scale=_SCALE_SQ for products)"""
+    return Decimal(value) / scale
+
 
 class RiskService(IRiskService):
     """Risk management service implementation"""
 
+    __slots__ = ('_max_position_scaled', '_max_daily_loss_scaled', '_max_trade_scaled',
+                 '_daily_loss_scaled', 'portfolio_service')
+
     def __init__(self,
                  max_position_size: Decimal = Decimal('1000.0'),
                  max_daily_loss: Decimal = Decimal('500.0'),
                  max_trade_size: Decimal = Decimal('100.0'),
-                 portfolio_service=None):
+                 portfolio_service: Optional[IPortfolioService] = None) -> None:
         self.max_position_size = max_position_size
         self.max_daily_loss = max_daily_loss
         self.max_trade_size = max_trade_size
-        self.portfolio_service = portfolio_service
-        self.daily_loss = Decimal('0.0')  # Track daily losses
+        self.portfolio_service: Final[Optional[IPortfolioService]] = portfolio_service
+        self._daily_loss_scaled: int = 0  # Track daily losses
 
         logger.info(
             f"RiskService initialized: max_position={max_position_size}, max_daily_loss={max_daily_loss}")
 
+    # Limits are exposed as Decimal but stored scaled, so runtime
+    # reconfiguration (see TradingBotFactory.create_strategy_engine) stays in sync
+    @property
+    def max_position_size(self) -> Decimal:
+        return _from_scaled(self._max_position_scaled)
+
+    @max_position_size.setter
+    def max_position_size(self, value: Decimal) -> None:
+        self._max_position_scaled = _to_scaled(value)
+
+    @property
+    def max_daily_loss(self) -> Decimal:
+        return _from_scaled(self._max_daily_loss_scaled)
+
+    @max_daily_loss.setter
+    def max_daily_loss(self, value: Decimal) -> None:
+        self._max_daily_loss_scaled = _to_scaled(value)
+
+    @property
+    def max_trade_size(self) -> Decimal:
+        return _from_scaled(self._max_trade_scaled)
+
+    @max_trade_size.setter
+    def max_trade_size(self, value: Decimal) -> None:
+        self._max_trade_scaled = _to_scaled(value)
+
+    @property
+    def daily_loss(self) -> Decimal:
+        """Accumulated loss for the current trading day"""
+        return _from_scaled(self._daily_loss_scaled)
+
     async def validate_buy_order(self, symbol: str, quantity: Decimal, price: Decimal) -> RiskCheckResult:
         """Validate buy order against risk parameters"""
         try:
             logger.debug(
                 f"Validating buy order: {symbol} qty={quantity} price={price}")
 
-            # Calculate trade value
-            trade_value = quantity * price
+            # Checks run cheapest first so most rejections skip exchange I/O:
+            # daily loss (scalar), trade size (one multiply), then balance and
+            # position from one portfolio snapshot
+
+            # Check daily loss limit
+            if self._daily_loss_scaled > self._max_daily_loss_scaled:
+                reason = f"Daily loss {self.daily_loss} exceeds limit {self.max_daily_loss}"
+                logger.warning(f"Buy order rejected: {reason}")
+                return RiskCheckResult(
+                    approved=False,
+                    reason=reason,
+                    risk_score=Decimal('0.9')
+                )
+
+            qty_scaled = _to_scaled(quantity)
+            price_scaled = _to_scaled(price)
+
+            # Calculate trade value (products are in SCALE^2 units)
+            trade_value_sq = qty_scaled * price_scaled
 
             # Check maximum trade size
-            if trade_value > self.max_trade_size:
-                reason = f"Trade value {trade_value} exceeds max trade size {self.max_trade_size}"
+            if trade_value_sq > self._max_trade_scaled * SCALE:
+                reason = f"Trade value {_from_scaled(trade_value_sq, _SCALE_SQ)} exceeds max trade size {self.max_trade_size}"
                 logger.warning(f"Buy order rejected: {reason}")
                 return RiskCheckResult(
                     approved=False,
@@ -47,11 +117,13 @@ class RiskService(IRiskService):
                     risk_score=Decimal('1.0')  # High risk
                 )
 
-            # Check account balance if portfolio service available
+            # Balance and position come from one portfolio snapshot
             if self.portfolio_service:
-                balance = await self.portfolio_service.get_account_balance()
-                if balance < trade_value:
-                    reason = f"Insufficient balance: need {trade_value}, have {balance}"
+                balance, existing_position = await self.portfolio_service.get_snapshot(symbol)
+
+                # Check account balance
+                if _to_scaled(balance) * SCALE < trade_value_sq:
+                    reason = f"Insufficient balance: need {_from_scaled(trade_value_sq, _SCALE_SQ)}, have {balance}"
                     logger.warning(f"Buy order rejected: {reason}")
                     return RiskCheckResult(
                         approved=False,
@@ -59,14 +131,12 @@ class RiskService(IRiskService):
                         risk_score=Decimal('1.0')
                     )
 
-            # Check position size limit
-            if self.portfolio_service:
-                existing_position = await self.portfolio_service.get_position(symbol)
+                # Check position size limit
                 if existing_position:
-                    new_position_value = (
-                        existing_position.quantity + quantity) * price
-                    if new_position_value > self.max_position_size:
-                        reason = f"Position size {new_position_value} would exceed limit {self.max_position_size}"
+                    new_position_sq = (
+                        _to_scaled(existing_position.quantity) + qty_scaled) * price_scaled
+                    if new_position_sq > self._max_position_scaled * SCALE:
+                        reason = f"Position size {_from_scaled(new_position_sq, _SCALE_SQ)} would exceed limit {self.max_position_size}"
                         logger.warning(f"Buy order rejected: {reason}")
                         return RiskCheckResult(
                             approved=False,
@@ -74,18 +144,9 @@ class RiskService(IRiskService):
                             risk_score=Decimal('0.8')
                         )
 
-            # Check daily loss limit
-            if self.daily_loss > self.max_daily_loss:
-                reason = f"Daily loss {self.daily_loss} exceeds limit {self.max_daily_loss}"
-                logger.warning(f"Buy order rejected: {reason}")
-                return RiskCheckResult(
-                    approved=False,
-                    reason=reason,
-                    risk_score=Decimal('0.9')
-                )
-
             # Calculate risk score based on trade size
-            risk_score = trade_value / self.max_trade_size
+            risk_score = Decimal(trade_value_sq) / \
+                (self._max_trade_scaled * SCALE)
 
             logger.info(
                 f"Buy order approved: {symbol} risk_score={risk_score}")
@@ -118,15 +179,16 @@ class RiskService(IRiskService):
                         risk_score=Decimal('1.0')
                     )
 
-                # Calculate potential loss/profit
-                potential_pnl = (
-                    current_price - position.avg_price) * position.quantity
+                # Calculate potential loss/profit (SCALE^2 units)
+                potential_pnl_sq = (
+                    _to_scaled(current_price) - _to_scaled(position.avg_price)) * _to_scaled(position.quantity)
 
                 # Check if selling would exceed daily loss limit
-                if potential_pnl < 0:  # Loss
-                    potential_daily_loss = self.daily_loss + abs(potential_pnl)
-                    if potential_daily_loss > self.max_daily_loss:
-                        reason = f"Selling would exceed daily loss limit: {potential_daily_loss} > {self.max_daily_loss}"
+                if potential_pnl_sq < 0:  # Loss
+                    potential_daily_loss_sq = self._daily_loss_scaled * \
+                        SCALE - potential_pnl_sq
+                    if potential_daily_loss_sq > self._max_daily_loss_scaled * SCALE:
+                        reason = f"Selling would exceed daily loss limit: {_from_scaled(potential_daily_loss_sq, _SCALE_SQ)} > {self.max_daily_loss}"
                         logger.warning(f"Sell order rejected: {reason}")
                         return RiskCheckResult(
                             approved=False,
@@ -135,8 +197,8 @@ class RiskService(IRiskService):
                         )
 
                 # Calculate risk score based on potential loss
-                risk_score = abs(
-                    potential_pnl) / self.max_daily_loss if potential_pnl < 0 else Decimal('0.1')
+                risk_score = Decimal(-potential_pnl_sq) / (self._max_daily_loss_scaled *
+                                                           SCALE) if potential_pnl_sq < 0 else Decimal('0.1')
             else:
                 # Medium risk without portfolio data
                 risk_score = Decimal('0.5')
@@ -154,13 +216,13 @@ class RiskService(IRiskService):
             raise RiskValidationError(
                 f"Sell order validation failed: {str(e)}", risk_type="sell_validation")
 
-    def update_daily_loss(self, loss_amount: Decimal):
+    def update_daily_loss(self, loss_amount: Decimal) -> None:
         """Update daily loss tracking"""
         if loss_amount > 0:
-            self.daily_loss += loss_amount
+            self._daily_loss_scaled += _to_scaled(loss_amount)
             logger.info(f"Daily loss updated: {self.daily_loss}")
 
-    def reset_daily_loss(self):
+    def reset_daily_loss(self) -> None:
         """Reset daily loss counter (call at start of new trading day)"""
-        self.daily_loss = Decimal('0.0')
+        self._daily_loss_scaled = 0
         logger.info("Daily loss counter reset")
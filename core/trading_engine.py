@@ -2,13 +2,15 @@
 Trading Engine - clean orchestration layer.
 CRITICAL: only coordinates services, no business logic, proper error handling.
 """
+import asyncio
 from decimal import Decimal
-from typing import Optional
+from typing import Optional, Set
 from .interfaces.trading_interfaces import (
     IMarketDataService, IRiskService, IOrderService,
     INotificationService, IPortfolioService, OrderSide, OrderStatus
 )
 from .exceptions.trading_exceptions import TradingError, RiskValidationError, OrderExecutionError
+from .kernels import ohlcv_reduce
 from utils.logger import get_trading_logger
 
 logger = get_trading_logger()
@@ -31,19 +33,34 @@ class TradingEngine:
         self.notifications = notification_service
         self.portfolio = portfolio_service
 
+        # Background notification tasks, drained on stop()
+        self._pending_notifications: Set[asyncio.Task] = set()
+
         logger.info("TradingEngine initialized with dependency injection")
 
+    def _notify(self, coro) -> None:
+        """Send notification in background so the trade path doesn't wait on Telegram"""
+        task = asyncio.create_task(coro)
+        self._pending_notifications.add(task)
+        task.add_done_callback(self._on_notification_done)
+
+    def _on_notification_done(self, task: asyncio.Task) -> None:
+        """Forget finished notification task and log its failure"""
+        self._pending_notifications.discard(task)
+        if not task.cancelled() and task.exception() is not None:
+            logger.error("Notification failed: %s", task.exception())
+
     async def execute_buy_signal(self, symbol: str, quantity: Decimal, price: Decimal) -> bool:
         """Execute buy order with full validation pipeline"""
         try:
             logger.info(
-                f"Processing buy signal: {symbol} qty={quantity} price={price}")
+                "Processing buy signal: %s qty=%s price=%s", symbol, quantity, price)
 
             # 1. Risk validation
             risk_check = await self.risk_service.validate_buy_order(symbol, quantity, price)
             if not risk_check.approved:
                 logger.warning(
-                    f"Buy order rejected by risk management: {risk_check.reason}")
+                    "Buy order rejected by risk management: %s", risk_check.reason)
                 await self.notifications.send_error_alert(
                     f"Buy order rejected: {risk_check.reason}",
                     "RISK_REJECTION"
@@ -53,54 +70,59 @@ class TradingEngine:
             # 2. Execute order
             result = await self.order_service.execute_buy_order(symbol, quantity, price)
             if result.status != OrderStatus.SUCCESS:
-                logger.error(f"Buy order execution failed: {result.message}")
+                logger.error("Buy order execution failed: %s", result.message)
                 await self.notifications.send_error_alert(
                     f"Buy order failed: {result.message}",
                     "ORDER_EXECUTION_ERROR"
                 )
                 return False
 
-            # 3. Send success notification
-            await self.notifications.send_trade_alert(symbol, OrderSide.BUY, result.executed_price)
+            # 3. Send success notification (background)
+            self._notify(self.notifications.send_trade_alert(
+                symbol, OrderSide.BUY, result.executed_price))
 
             logger.info(
-                f"Buy order completed successfully: {symbol} @ {result.executed_price}")
+                "Buy order completed successfully: %s @ %s", symbol, result.executed_price)
             return True
 
         except RiskValidationError as e:
-            logger.error(f"Risk validation error in buy signal: {e}")
+            logger.error("Risk validation error in buy signal: %s", e)
             await self.notifications.send_error_alert(str(e), "RISK_ERROR")
             return False
         except OrderExecutionError as e:
-            logger.error(f"Order execution error in buy signal: {e}")
+            logger.error("Order execution error in buy signal: %s", e)
             await self.notifications.send_error_alert(str(e), "EXECUTION_ERROR")
             return False
         except Exception as e:
-            logger.error(f"Unexpected error in buy signal: {e}", exc_info=True)
+            logger.error("Unexpected error in buy signal: %s", e, exc_info=True)
             await self.notifications.send_error_alert(str(e), "UNEXPECTED_ERROR")
             return False
 
     async def execute_sell_signal(self, symbol: str, current_price: Optional[Decimal] = None) -> bool:
         """Execute sell order with full validation pipeline"""
         try:
-            # Get current price if not provided
+            # Get current price if not provided, together with the position
             if current_price is None:
-                current_price = await self.market_data.get_current_price(symbol)
+                current_price, position = await asyncio.gather(
+                    self.market_data.get_current_price(symbol),
+                    self.portfolio.get_position(symbol)
+                )
+            else:
+                position = await self.portfolio.get_position(symbol)
 
             logger.info(
-                f"Processing sell signal: {symbol} price={current_price}")
+                "Processing sell signal: %s price=%s", symbol, current_price)
 
             # 1. Check if we have position to sell
-            position = await self.portfolio.get_position(symbol)
             if not position or position.quantity <= 0:
-                logger.warning(f"No position found to sell for {symbol}")
+                logger.warning("No position found to sell for %s", symbol)
                 return False
 
             # 2. Risk validation
             risk_check = await self.risk_service.validate_sell_order(symbol, current_price)
             if not risk_check.approved:
                 logger.warning(
-                    f"Sell order rejected by risk management: {risk_check.reason}")
+                    "Sell order rejected by risk management: %s", risk_check.reason)
                 await self.notifications.send_error_alert(
                     f"Sell order rejected: {risk_check.reason}",
                     "RISK_REJECTION"
@@ -110,14 +132,14 @@ class TradingEngine:
             # 3. Execute sell order
             result = await self.order_service.execute_sell_order(symbol, position.quantity, current_price)
             if result.status != OrderStatus.SUCCESS:
-                logger.error(f"Sell order execution failed: {result.message}")
+                logger.error("Sell order execution failed: %s", result.message)
                 await self.notifications.send_error_alert(
                     f"Sell order failed: {result.message}",
                     "ORDER_EXECUTION_ERROR"
                 )
                 return False
 
-            # 4. Calculate profit/loss
+            # 4. Calculate profit/loss - kept in Decimal, it feeds the daily loss limit
             profit = None
             if position.avg_price > 0:
                 profit = (result.executed_price - position.avg_price) * \
@@ -127,25 +149,30 @@ class TradingEngine:
                 if profit < 0:
                     self.risk_service.update_daily_loss(abs(profit))
 
-            # 5. Send success notification
-            await self.notifications.send_trade_alert(symbol, OrderSide.SELL, result.executed_price, profit)
+            # 5. Send success notification (background)
+            self._notify(self.notifications.send_trade_alert(
+                symbol, OrderSide.SELL, result.executed_price, profit))
 
             logger.info(
-                f"Sell order completed successfully: {symbol} @ {result.executed_price} (P&L: {profit})")
+                "Sell order completed successfully: %s @ %s (P&L: %s)",
+                symbol, result.executed_price, profit)
             return True
 
         except Exception as e:
             logger.error(
-                f"Unexpected error in sell signal: {e}", exc_info=True)
+                "Unexpected error in sell signal: %s", e, exc_info=True)
             await self.notifications.send_error_alert(str(e), "SELL_ERROR")
             return False
 
     async def get_portfolio_status(self) -> dict:
         """Get comprehensive portfolio status"""
         try:
-            balance = await self.portfolio.get_account_balance()
-            positions = await self.portfolio.get_all_positions()
-            total_value = await self.portfolio.get_total_portfolio_value()
+            # Independent reads - issue together, they share one account refresh
+            balance, positions, total_value = await asyncio.gather(
+                self.portfolio.get_account_balance(),
+                self.portfolio.get_all_positions(),
+                self.portfolio.get_total_portfolio_value()
+            )
 
             return {
                 "balance_usdt": balance,
@@ -159,28 +186,39 @@ class TradingEngine:
             }
 
         except Exception as e:
-            logger.error(f"Failed to get portfolio status: {e}")
-            return {}
+            # Callers decide how to recover (the probe loop backs off)
+            logger.error("Failed to get portfolio status: %s", e)
+            raise
 
     async def check_market_conditions(self, symbol: str) -> dict:
         """Check current market conditions for symbol"""
         try:
-            current_price = await self.market_data.get_current_price(symbol)
-            # Last 24 hours
-            klines = await self.market_data.get_klines(symbol, "1h", 24)
+            # Current price and last 24 hours of klines, fetched concurrently
+            current_price, klines = await asyncio.gather(
+                self.market_data.get_current_price(symbol),
+                self.market_data.get_klines(symbol, "1h", 24)
+            )
+
+            if not klines or len(klines['open']) == 0:
+                logger.warning("No kline data for %s", symbol)
+                return {}
+
+            # Single-pass high/low/volume reduction (float, display only)
+            high, low, volume, first_open = ohlcv_reduce(
+                klines['open'], klines['high'], klines['low'], klines['volume'])
 
             return {
                 "symbol": symbol,
                 "current_price": current_price,
-                "24h_high": max(kline['high'] for kline in klines),
-                "24h_low": min(kline['low'] for kline in klines),
-                "24h_volume": sum(kline['volume'] for kline in klines),
-                "price_change_24h": current_price - klines[0]['open'] if klines else Decimal('0')
+                "24h_high": high,
+                "24h_low": low,
+                "24h_volume": volume,
+                "price_change_24h": float(current_price) - first_open
             }
 
         except Exception as e:
             logger.error(
-                f"Failed to check market conditions for {symbol}: {e}")
+                "Failed to check market conditions for %s: %s", symbol, e)
             return {}
 
     async def send_daily_summary(self) -> bool:
@@ -195,7 +233,7 @@ class TradingEngine:
             return await self.notifications.send_daily_summary(total_trades, total_profit, win_rate)
 
         except Exception as e:
-            logger.error(f"Failed to send daily summary: {e}")
+            logger.error("Failed to send daily summary: %s", e)
             return False
 
     async def start(self):
@@ -207,6 +245,9 @@ class TradingEngine:
     async def stop(self):
         """Stop trading engine gracefully"""
         logger.info("Trading engine stopping...")
+        # Let in-flight notifications finish before closing connections
+        if self._pending_notifications:
+            await asyncio.gather(*self._pending_notifications, return_exceptions=True)
         # Close service connections
         if hasattr(self.order_service, 'close'):
             await self.order_service.close()
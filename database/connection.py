@@ -6,6 +6,10 @@ Handles SQLite for development, PostgreSQL for production.
 import asyncio
 import os
 from contextlib import asynccontextmanager
+from functools import lru_cache
+from typing import List, Union
+from sqlalchemy import event, insert, text
+from sqlalchemy.sql.elements import TextClause
 from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession, async_sessionmaker
 from sqlalchemy.pool import StaticPool
 
@@ -18,6 +22,31 @@ logger = get_system_logger()
 engine = None
 SessionLocal = None
 
+# Built once so SQLAlchemy's compiled cache is hit on every health check
+_HEALTH_STMT = text("SELECT 1")
+
+
+def _set_sqlite_pragmas(dbapi_connection, connection_record):
+    """Tune SQLite for a write-heavy workload (WAL lets reads run during writes)"""
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.execute("PRAGMA synchronous=NORMAL")  # Safe with WAL, fsync per checkpoint
+    cursor.execute("PRAGMA cache_size=-64000")  # 64MB page cache
+    cursor.execute("PRAGMA temp_store=MEMORY")
+    cursor.execute("PRAGMA mmap_size=268435456")  # 256MB
+    cursor.close()
+
+
+def _create_missing_indexes(connection):
+    """
+    Create model indexes that don't exist yet. create_all() skips tables
+    that already exist - including their indexes - so databases created
+    before an index was added to a model only get it here (non-destructive).
+    """
+    for table in Base.metadata.sorted_tables:
+        for index in table.indexes:
+            index.create(connection, checkfirst=True)
+
 
 async def init_database(database_url: str = None):
     """
@@ -34,22 +63,28 @@ async def init_database(database_url: str = None):
     
     # Create async engine
     if "sqlite" in database_url:
-        # SQLite specific settings
+        # SQLite specific settings - file databases use the default pool so
+        # concurrent sessions get their own connection (WAL allows parallel
+        # reads); an in-memory database only exists on a single connection
+        pool_kwargs = {"poolclass": StaticPool} if ":memory:" in database_url else {}
         engine = create_async_engine(
             database_url,
-            poolclass=StaticPool,
             connect_args={
                 "check_same_thread": False,
-                "timeout": 20
+                "timeout": 30
             },
-            echo=False  # Set to True for SQL debugging
+            echo=False,  # Set to True for SQL debugging
+            **pool_kwargs
         )
+        event.listen(engine.sync_engine, "connect", _set_sqlite_pragmas)
     else:
         # PostgreSQL settings
         engine = create_async_engine(
             database_url,
             pool_size=10,
             max_overflow=20,
+            pool_pre_ping=True,  # Drop connections closed by the server
+            pool_recycle=300,  # Recycle before idle timeouts kick in
             echo=False
         )
     
@@ -60,9 +95,10 @@ async def init_database(database_url: str = None):
         expire_on_commit=False
     )
     
-    # Create all tables
+    # Create all tables, and indexes added to existing tables since
     async with engine.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
+        await conn.run_sync(_create_missing_indexes)
     
     logger.info(f"Database initialized: {database_url}")
 
@@ -103,13 +139,30 @@ async def check_database_health() -> bool:
     """Check if database is accessible"""
     try:
         async with get_db_session() as session:
-            result = await session.execute("SELECT 1")
+            result = await session.execute(_HEALTH_STMT)
             return result.scalar() == 1
     except Exception as e:
         logger.error(f"Database health check failed: {e}")
         return False
 
 
+# Bulk write helper
+async def bulk_insert(model, rows: List[dict]) -> int:
+    """
+    Insert many rows in one executemany round-trip (no ORM unit of work).
+    Generated keys are not returned - use session.add() when they are needed.
+    Usage:
+        await bulk_insert(Trade, [{"symbol": "BTCUSDT", "side": "BUY", ...}, ...])
+    """
+    if not rows:
+        return 0
+
+    async with get_db_session() as session:
+        await session.execute(insert(model), rows)
+        await session.commit()
+    return len(rows)
+
+
 # Migration helper (basic)
 async def run_migrations():
     """
@@ -131,9 +184,16 @@ async def run_migrations():
 
 
 # Utility function for raw SQL queries
-async def execute_raw_sql(query: str, params: dict = None):
-    """Execute raw SQL query (use sparingly)"""
+@lru_cache(maxsize=256)
+def _text_statement(query: str) -> TextClause:
+    """Build text() construct once per distinct query string"""
+    return text(query)
+
+
+async def execute_raw_sql(query: Union[str, TextClause], params: dict = None):
+    """Execute raw SQL query with bound parameters (use sparingly)"""
+    statement = _text_statement(query) if isinstance(query, str) else query
     async with get_db_session() as session:
-        result = await session.execute(query, params or {})
+        result = await session.execute(statement, params or {})
         await session.commit()
-        return result
\ No newline at end of file
+        return result
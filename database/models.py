@@ -3,7 +3,8 @@
 Database models replacing JSON file storage.
 Type-safe, validated, with proper relationships.
 """
-from sqlalchemy import Column, String, Numeric, DateTime, Boolean, Text, Integer
+from sqlalchemy import Column, String, Numeric, DateTime, Boolean, Text, Integer, Index, JSON
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.sql import func
 from datetime import datetime
@@ -28,6 +29,11 @@ class Position(Base):
 class Trade(Base):
     """Complete trading history with profit tracking"""
     __tablename__ = "trades"
+    __table_args__ = (
+        Index('ix_trades_symbol_created', 'symbol', 'created_at'),
+        Index('ix_trades_strategy_created', 'strategy', 'created_at'),
+        Index('ix_trades_side', 'side'),
+    )
     
     id = Column(Integer, primary_key=True, autoincrement=True)
     symbol = Column(String(20), nullable=False)
@@ -52,8 +58,8 @@ class TradingProfile(Base):
     strategy = Column(String(50), nullable=False)
     timeframe = Column(String(10), nullable=False)  # "1m", "5m", "1h", etc.
     
-    # Strategy parameters as JSON
-    config = Column(Text, nullable=False)  # JSON string with strategy config
+    # Strategy parameters as native JSON (JSONB on PostgreSQL), (de)serialized by SQLAlchemy
+    config = Column(JSON().with_variant(JSONB(), "postgresql"), nullable=False)
     
     # Risk management
     use_stop_loss = Column(Boolean, default=True)
@@ -93,6 +99,9 @@ class TelegramUser(Base):
 class SystemLog(Base):
     """System events and errors for debugging"""
     __tablename__ = "system_logs"
+    __table_args__ = (
+        Index('ix_logs_level_created', 'level', 'created_at'),
+    )
     
     id = Column(Integer, primary_key=True, autoincrement=True)
     level = Column(String(10), nullable=False)  # INFO, WARNING, ERROR, CRITICAL
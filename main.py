@@ -3,86 +3,180 @@ Main entry point for the trading bot.
 CRITICAL: proper DI initialization, database setup, graceful shutdown.
 """
 import asyncio
+import importlib
+import inspect
+import random
 import sys
 import signal
+from functools import lru_cache, wraps
 from pathlib import Path
+from typing import TYPE_CHECKING, Callable, Dict, Optional
+
+try:
+    import uvloop  # libuv-based event loop, not available on Windows
+except ImportError:
+    uvloop = None
 from config.settings import settings
-from core.factory import create_trading_engine
-from database.connection import init_database
 from utils.logger import get_system_logger
 
+# Heavy modules (numpy, aiohttp, SQLAlchemy) are imported by the functions
+# that need them, so --help and argument errors return immediately
+if TYPE_CHECKING:
+    import aiohttp
+
 logger = get_system_logger()
 
 # Global trading engine instance
 trading_engine = None
 
+# HTTP session shared by the Binance and Telegram clients (keep-alive pool)
+http_session: Optional["aiohttp.ClientSession"] = None
+
+# Set by signal handlers; the trading loop waits on it instead of polling
+shutdown_event = asyncio.Event()
+
+# Task running main(); signals cancel it when nothing waits on shutdown_event
+_main_task: Optional[asyncio.Task] = None
+
+# True while start_trading() waits on shutdown_event
+_trading_loop_running = False
+
+PORTFOLIO_PROBE_INTERVAL = 10  # seconds between portfolio status checks
+PORTFOLIO_PROBE_BACKOFF_MIN = 1.0  # first retry delay after a failed check
+PORTFOLIO_PROBE_BACKOFF_MAX = 300.0  # retry delay ceiling during outages
+SHUTDOWN_TIMEOUT = 15  # seconds allowed for trading_engine.stop()
+
+# Strategy name -> StrategyFactory builder taking the market data service.
+# The factory module is only imported when a strategy is first run.
+_STRATEGY_BUILDERS: Dict[str, str] = {
+    "rsi_macd": "create_rsi_macd_strategy",
+    "simple_rsi": "create_simple_rsi_strategy",
+    "bollinger_rsi": "create_bollinger_rsi_strategy",
+    "sma_crossover": "create_sma_crossover_strategy",
+    "custom": "create_default_custom_strategy",
+    "grid": "create_grid_strategy",
+    "dca": "create_dca_strategy",
+}
+DEFAULT_STRATEGY = "rsi_macd"
+
+
+def log_errors(message: str):
+    """
+    Log failures of a top-level coroutine as '<message>: <error>' and re-raise.
+    The message may name the call's arguments, e.g. "Strategy {strategy_name} failed".
+    """
+    def decorator(func):
+        signature = inspect.signature(func)
+
+        @wraps(func)
+        async def wrapper(*args, **kwargs):
+            try:
+                return await func(*args, **kwargs)
+            except Exception as e:
+                call_args = signature.bind(*args, **kwargs).arguments
+                logger.error(f"{message.format(**call_args)}: {e}")
+                raise
+        return wrapper
+    return decorator
+
+
+def _load_indicator_kernels():
+    """Import (compiling or loading cached code) and run the indicator kernels"""
+    from strategies.indicators.kernels import warmup
+    warmup()
+
 
+@log_errors("System initialization failed")
 async def initialize_system():
     """Initialize database and core systems"""
-    try:
-        logger.info("Initializing trading bot system...")
+    from database.connection import init_database
 
-        # Initialize database connection
-        if hasattr(settings, 'database') and settings.database.url:
-            await init_database(settings.database.url)
-            logger.info("Database initialized successfully")
-        else:
-            logger.warning(
-                "No database configuration found, running without persistence")
+    logger.info("Initializing trading bot system...")
 
-        logger.info("System initialization completed")
+    # Load indicator kernels in a worker thread so the event loop keeps
+    # handling signals, and the first analysis does not pay for it
+    await asyncio.to_thread(_load_indicator_kernels)
 
-    except Exception as e:
-        logger.error(f"System initialization failed: {e}")
-        raise
+    # Initialize database connection
+    if hasattr(settings, 'database') and settings.database.url:
+        await init_database(settings.database.url)
+        logger.info("Database initialized successfully")
+    else:
+        logger.warning(
+            "No database configuration found, running without persistence")
 
+    logger.info("System initialization completed")
 
+
+@log_errors("Failed to create trading bot")
 async def create_bot():
     """Create trading bot with proper dependency injection"""
-    global trading_engine
+    global trading_engine, http_session
+    import aiohttp
 
-    try:
-        logger.info("Creating trading bot with dependency injection...")
+    logger.info("Creating trading bot with dependency injection...")
 
-        # Create trading engine through factory
-        trading_engine = create_trading_engine(settings)
+    # The factory pulls in the core kernels - import it off the event loop too
+    factory = await asyncio.to_thread(importlib.import_module, "core.factory")
 
-        logger.info("Trading bot created successfully")
-        return trading_engine
+    # One pooled session so every API call reuses open TLS connections
+    http_session = aiohttp.ClientSession(connector=aiohttp.TCPConnector(
+        limit=100,
+        limit_per_host=30,
+        keepalive_timeout=75,
+        ttl_dns_cache=300
+    ))
 
-    except Exception as e:
-        logger.error(f"Failed to create trading bot: {e}")
-        raise
+    # Create trading engine through factory
+    trading_engine = factory.create_trading_engine(settings, http_session)
 
+    logger.info("Trading bot created successfully")
+    return trading_engine
 
-async def start_trading():
-    """Start the main trading loop"""
-    try:
-        logger.info("Starting trading operations...")
 
-        # Start trading engine
-        await trading_engine.start()
+async def _portfolio_probe_loop():
+    """Check portfolio status periodically until shutdown is requested"""
+    error_backoff = PORTFOLIO_PROBE_BACKOFF_MIN
+    while not shutdown_event.is_set():
+        try:
+            portfolio_status = await trading_engine.get_portfolio_status()
+            logger.debug("Portfolio status: %s", portfolio_status)
+            delay = PORTFOLIO_PROBE_INTERVAL
+            error_backoff = PORTFOLIO_PROBE_BACKOFF_MIN
+        except Exception as e:
+            # Exponential backoff with jitter so retries don't run in lockstep
+            delay = min(PORTFOLIO_PROBE_BACKOFF_MAX,
+                        error_backoff * (1 + random.random() * 0.5))
+            error_backoff = min(PORTFOLIO_PROBE_BACKOFF_MAX, error_backoff * 2)
+            logger.error(
+                f"Error in trading loop: {e} (retrying in {delay:.1f}s)")
+
+        # Sleep for the interval, waking early on shutdown
+        try:
+            await asyncio.wait_for(shutdown_event.wait(), timeout=delay)
+        except asyncio.TimeoutError:
+            pass
 
-        # Keep running until shutdown signal
-        while True:
-            try:
-                # Check portfolio status periodically
-                portfolio_status = await trading_engine.get_portfolio_status()
-                logger.debug(f"Portfolio status: {portfolio_status}")
 
-                # Sleep for a short interval
-                await asyncio.sleep(10)
+@log_errors("Trading loop failed")
+async def start_trading():
+    """Start the main trading loop"""
+    global _trading_loop_running
+    logger.info("Starting trading operations...")
 
-            except KeyboardInterrupt:
-                logger.info("Shutdown requested by user")
-                break
-            except Exception as e:
-                logger.error(f"Error in trading loop: {e}")
-                await asyncio.sleep(30)  # Wait before retrying
+    # Start trading engine
+    await trading_engine.start()
 
-    except Exception as e:
-        logger.error(f"Trading loop failed: {e}")
-        raise
+    # Keep running until shutdown signal
+    probe_task = asyncio.create_task(_portfolio_probe_loop())
+    _trading_loop_running = True
+    try:
+        await shutdown_event.wait()
+        logger.info("Shutdown requested, leaving trading loop")
+    finally:
+        _trading_loop_running = False
+        probe_task.cancel()
+        await asyncio.gather(probe_task, return_exceptions=True)
 
 
 async def shutdown_gracefully():
@@ -91,7 +185,11 @@ async def shutdown_gracefully():
         logger.info("Initiating graceful shutdown...")
 
         if trading_engine:
-            await trading_engine.stop()
+            await asyncio.wait_for(trading_engine.stop(), timeout=SHUTDOWN_TIMEOUT)
+
+        # Close shared HTTP session after the clients using it have stopped
+        if http_session and not http_session.closed:
+            await http_session.close()
 
         # Close database connections
         # await close_database_connections()
@@ -102,72 +200,59 @@ async def shutdown_gracefully():
         logger.error(f"Error during shutdown: {e}")
 
 
-def setup_signal_handlers():
+def _request_shutdown(signum: int):
+    """Wake everything waiting on shutdown_event (runs on the event loop)"""
+    logger.info(f"Received signal {signum}")
+    if shutdown_event.is_set():
+        return
+    shutdown_event.set()
+
+    # During init and one-shot commands nothing waits on the event -
+    # interrupt main() instead, its finally block still shuts down
+    if not _trading_loop_running and _main_task is not None:
+        _main_task.cancel()
+
+
+def setup_signal_handlers(loop: asyncio.AbstractEventLoop):
     """Setup signal handlers for graceful shutdown"""
+    if sys.platform != "win32":
+        # Handlers run as loop callbacks, so they can touch asyncio objects
+        for sig in (signal.SIGINT, signal.SIGTERM):
+            loop.add_signal_handler(sig, _request_shutdown, sig)
+        return
+
+    # add_signal_handler is not supported on Windows - hand the signal
+    # over to the loop thread instead of acting in the signal context
     def signal_handler(signum, frame):
-        logger.info(f"Received signal {signum}")
-        # Set a flag or raise an exception to break the main loop
-        asyncio.create_task(shutdown_gracefully())
-        sys.exit(0)
+        loop.call_soon_threadsafe(_request_shutdown, signum)
 
     signal.signal(signal.SIGINT, signal_handler)
     signal.signal(signal.SIGTERM, signal_handler)
 
 
+@lru_cache(maxsize=None)
+def _resolve_strategy_builder(strategy_name: str) -> Callable:
+    """Import the strategy factory on first use and remember the builder"""
+    factory = importlib.import_module("strategies.strategy_factory").StrategyFactory
+    return getattr(factory, _STRATEGY_BUILDERS[strategy_name])
+
+
+@log_errors("Strategy {strategy_name} failed")
 async def run_strategy(strategy_name: str):
     """Run specific trading strategy using modular architecture"""
-    try:
-        logger.info(f"Running strategy: {strategy_name}")
-
-        # Create market data service instance
-        market_data_service = trading_engine.market_data
-
-        # Use new modular indicator system
-        if strategy_name == "rsi_macd":
-            from strategies.strategy_factory import StrategyFactory
-            strategy = StrategyFactory.create_rsi_macd_strategy(
-                market_data_service)
-        elif strategy_name == "simple_rsi":
-            from strategies.strategy_factory import StrategyFactory
-            strategy = StrategyFactory.create_simple_rsi_strategy(
-                market_data_service)
-        elif strategy_name == "bollinger_rsi":
-            from strategies.strategy_factory import StrategyFactory
-            strategy = StrategyFactory.create_bollinger_rsi_strategy(
-                market_data_service)
-        elif strategy_name == "sma_crossover":
-            from strategies.strategy_factory import StrategyFactory
-            strategy = StrategyFactory.create_sma_crossover_strategy(
-                market_data_service)
-        elif strategy_name == "custom":
-            # Load custom strategy from config
-            from strategies.strategy_config import StrategyConfigs
-            from strategies.strategy_factory import StrategyFactory
-            config = StrategyConfigs.get_rsi_macd_ema_config()
-            strategy = StrategyFactory.create_custom_strategy(
-                config, market_data_service)
-        elif strategy_name == "grid":
-            from strategies.grid_strategy import GridTradingStrategy, GridConfig
-            config = GridConfig(symbol="BTCUSDT", timeframe="1h")
-            strategy = GridTradingStrategy(config, market_data_service)
-        elif strategy_name == "dca":
-            from strategies.dca_strategy import DCAStrategy, DCAConfig
-            config = DCAConfig(symbol="BTCUSDT", timeframe="1h")
-            strategy = DCAStrategy(config, market_data_service)
-        else:
-            logger.warning(
-                f"Unknown strategy: {strategy_name}. Available: rsi_macd, simple_rsi, bollinger_rsi, sma_crossover, custom, grid, dca")
-            # Default to RSI+MACD strategy
-            from strategies.strategy_factory import StrategyFactory
-            strategy = StrategyFactory.create_rsi_macd_strategy(
-                market_data_service)
+    logger.info(f"Running strategy: {strategy_name}")
 
-        # Run strategy
-        await strategy.run()
+    if strategy_name not in _STRATEGY_BUILDERS:
+        logger.warning(
+            f"Unknown strategy: {strategy_name}. Available: {', '.join(_STRATEGY_BUILDERS)}")
+        # Default to RSI+MACD strategy
+        strategy_name = DEFAULT_STRATEGY
 
-    except Exception as e:
-        logger.error(f"Strategy {strategy_name} failed: {e}")
-        raise
+    # Build strategy on the shared market data service
+    strategy = _resolve_strategy_builder(strategy_name)(trading_engine.market_data)
+
+    # Run strategy
+    await strategy.run()
 
 
 async def health_check():
@@ -179,21 +264,22 @@ async def health_check():
             logger.error("Trading engine not initialized")
             return False
 
-        # Check market data connectivity
-        try:
-            btc_price = await trading_engine.market_data.get_current_price("BTCUSDT")
-            logger.info(f"Market data check passed: BTC price = {btc_price}")
-        except Exception as e:
-            logger.error(f"Market data check failed: {e}")
+        # Check market data connectivity and account balance concurrently
+        btc_price, balance = await asyncio.gather(
+            trading_engine.market_data.get_current_price("BTCUSDT"),
+            trading_engine.portfolio.get_account_balance(),
+            return_exceptions=True
+        )
+
+        if isinstance(btc_price, Exception):
+            logger.error(f"Market data check failed: {btc_price}")
             return False
+        logger.info(f"Market data check passed: BTC price = {btc_price}")
 
-        # Check account balance
-        try:
-            balance = await trading_engine.portfolio.get_account_balance()
-            logger.info(f"Account balance check passed: {balance} USDT")
-        except Exception as e:
-            logger.error(f"Account balance check failed: {e}")
+        if isinstance(balance, Exception):
+            logger.error(f"Account balance check failed: {balance}")
             return False
+        logger.info(f"Account balance check passed: {balance} USDT")
 
         logger.info("Health check completed successfully")
         return True
@@ -233,11 +319,31 @@ async def send_test_notification():
         return False
 
 
+def parse_args():
+    """Parse command line arguments"""
+    import argparse
+    parser = argparse.ArgumentParser(description="Advanced Trading Bot")
+    parser.add_argument("--strategy", type=str, help="Strategy to run")
+    parser.add_argument(
+        "--health-check", action="store_true", help="Perform health check")
+    parser.add_argument("--test-notification",
+                        action="store_true", help="Send test notification")
+    parser.add_argument("--portfolio-status",
+                        action="store_true", help="Show portfolio status")
+
+    return parser.parse_args()
+
+
 async def main():
     """Main entry point with proper error handling and DI"""
+    global _main_task
+    # Parse command line arguments before any system setup
+    args = parse_args()
+
     try:
         # Setup signal handlers
-        setup_signal_handlers()
+        _main_task = asyncio.current_task()
+        setup_signal_handlers(asyncio.get_running_loop())
 
         # Initialize system
         await initialize_system()
@@ -245,19 +351,6 @@ async def main():
         # Create trading bot
         await create_bot()
 
-        # Parse command line arguments
-        import argparse
-        parser = argparse.ArgumentParser(description="Advanced Trading Bot")
-        parser.add_argument("--strategy", type=str, help="Strategy to run")
-        parser.add_argument(
-            "--health-check", action="store_true", help="Perform health check")
-        parser.add_argument("--test-notification",
-                            action="store_true", help="Send test notification")
-        parser.add_argument("--portfolio-status",
-                            action="store_true", help="Show portfolio status")
-
-        args = parser.parse_args()
-
         # Handle different commands
         if args.health_check:
             success = await health_check()
@@ -268,7 +361,10 @@ async def main():
             sys.exit(0 if success else 1)
 
         elif args.portfolio_status:
-            status = await trading_engine.get_portfolio_status()
+            try:
+                status = await trading_engine.get_portfolio_status()
+            except Exception:
+                status = {}
             print(f"Portfolio Status: {status}")
             sys.exit(0)
 
@@ -281,6 +377,10 @@ async def main():
 
     except KeyboardInterrupt:
         logger.info("Shutdown requested by user")
+    except asyncio.CancelledError:
+        # Cancelled by _request_shutdown - clear it so shutdown can await
+        asyncio.current_task().uncancel()
+        logger.info("Shutdown requested by user")
     except Exception as e:
         logger.error(f"Critical error in main: {e}", exc_info=True)
         sys.exit(1)
@@ -289,9 +389,11 @@ async def main():
 
 
 if __name__ == "__main__":
-    # Run main with proper event loop handling
+    # Run main with proper event loop handling - uvloop when installed,
+    # otherwise the default asyncio loop (Proactor on Windows)
+    run = uvloop.run if uvloop is not None else asyncio.run
     try:
-        asyncio.run(main())
+        run(main())
     except KeyboardInterrupt:
         logger.info("Application interrupted by user")
     except Exception as e:
@@ -3,11 +3,15 @@
 Base strategy engine with clean interface for trading decisions.
 Provides common functionality for all strategies in the modular architecture.
 """
+import importlib
+import logging
+import warnings
 from abc import ABC, abstractmethod
 from decimal import Decimal
-from typing import Dict, Any, List, Optional, Protocol
+from typing import Dict, Any, Hashable, List, Optional, Protocol, Sequence, Tuple, Union
 from dataclasses import dataclass
 from enum import Enum
+from functools import lru_cache
 import numpy as np
 
 from utils.logger import get_strategy_logger
@@ -41,7 +45,7 @@ class SignalStrength(Enum):
     STRONG = 3
 
 
-@dataclass
+@dataclass(slots=True)
 class TradingSignal:
     """Trading signal with context"""
     signal: SignalType
@@ -52,7 +56,7 @@ class TradingSignal:
     indicators: Dict[str, Any] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class StrategyConfig:
     """Base strategy configuration"""
     symbol: str
@@ -64,6 +68,15 @@ class StrategyConfig:
     stop_loss_pct: Decimal = Decimal('-0.02')
     take_profit_pct: Decimal = Decimal('0.05')
 
+    def __post_init__(self):
+        """Validate base configuration once, at construction"""
+        if not self.symbol:
+            raise ValueError("Symbol is required")
+        if not self.timeframe:
+            raise ValueError("Timeframe is required")
+        if self.min_history_required < 1:
+            raise ValueError("Min history must be positive")
+
 
 class BaseStrategy(ABC):
     """
@@ -77,10 +90,27 @@ class BaseStrategy(ABC):
         self.logger = logger
         self.name = self.__class__.__name__
 
-        # Price history for indicators
-        self.price_history: List[Decimal] = []
+        # Price history for indicators - float64 ring buffer; prices only
+        # become Decimal again at the order/API boundary. The buffer holds
+        # the ring twice (slot i mirrored at i + capacity), so the window is
+        # always one contiguous slice and never has to be unrolled.
+        self._prices: np.ndarray = np.empty(0, dtype=np.float64)
+        self._capacity: int = 0
+        self._head: int = 0  # Next slot to write
+        self._count: int = 0
+        self._price_version: int = 0  # Bumped on every history change
         self.max_history_length = 500  # Keep last 500 candles
 
+        # Indicators updated on every new price (e.g. IncrementalSMA)
+        self._streaming_indicators: List[Any] = []
+
+        # Resolved on first use - subclasses may set up indicators after super().__init__
+        self._history_threshold: Optional[int] = None
+
+        # (tick, signal) of the last should_buy/should_sell analysis, so
+        # checking both directions on one tick analyzes once
+        self._last_analysis: Optional[Tuple[Hashable, TradingSignal]] = None
+
         self.logger.info(
             f"Strategy initialized: {self.name} for {config.symbol}")
 
@@ -97,50 +127,148 @@ class BaseStrategy(ABC):
         """Return minimum price history required for analysis"""
         pass
 
-    def add_price(self, price: Decimal):
-        """Add new price to history"""
-        self.price_history.append(price)
+    @property
+    def max_history_length(self) -> int:
+        """Number of prices kept in history"""
+        return self._capacity
+
+    @max_history_length.setter
+    def max_history_length(self, length: int):
+        """Resize the ring buffer, keeping the most recent prices"""
+        if length < 1:
+            raise ValueError("max_history_length must be positive")
+        recent = self.get_price_array()[-length:] if self._capacity else self._prices
+        prices = np.empty(2 * length, dtype=np.float64)
+        prices[:len(recent)] = recent
+        prices[length:length + len(recent)] = recent
+        self._prices = prices
+        self._capacity = length
+        self._count = len(recent)
+        self._head = self._count % length
+        self._price_version += 1
+
+    @property
+    def price_version(self) -> int:
+        """Counter that changes whenever price history changes (cache key)"""
+        return self._price_version
+
+    @property
+    def price_history(self) -> List[Decimal]:
+        """Price history as Decimals (built on each access - prefer get_price_array)"""
+        return [Decimal(repr(p)) for p in self.get_price_array().tolist()]
 
-        # Maintain max history length
-        if len(self.price_history) > self.max_history_length:
-            self.price_history = self.price_history[-self.max_history_length:]
+    def add_price(self, price: Decimal):
+        """Add new price to history (single-tick fast path of add_prices)"""
+        capacity = self._capacity
+        value = float(price)
+        self._prices[self._head] = value
+        self._prices[self._head + capacity] = value
+        self._head = (self._head + 1) % capacity
+        self._count = min(self._count + 1, capacity)
+        self._price_version += 1
+        for indicator in self._streaming_indicators:
+            indicator.add(value)
+
+        # Called on every tick - skip the logging call entirely unless DEBUG is on
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug(
+                "Price added: %s (history length: %d)", price, self._count)
 
-        self.logger.debug(
-            f"Price added: {price} (history length: {len(self.price_history)})")
+    def add_prices(self, prices: Union[Sequence[Decimal], np.ndarray]):
+        """
+        Add a batch of prices (oldest first) in one bulk update.
+        Prefer this over repeated add_price calls when ticks arrive in bursts.
+        Float arrays (e.g. kline closes) are copied in without conversion.
+        """
+        if len(prices) == 0:
+            return
+
+        capacity = self._capacity
+        if isinstance(prices, np.ndarray):
+            values = prices.astype(np.float64, copy=False)[-capacity:]
+        else:
+            values = np.fromiter(map(float, prices), dtype=np.float64,
+                                 count=len(prices))[-capacity:]
+
+        # Write in at most two slices, wrapping around the ring end, into
+        # both copies of the ring
+        count = len(values)
+        first = min(count, capacity - self._head)
+        rest = count - first
+        for offset in (0, capacity):
+            start = self._head + offset
+            self._prices[start:start + first] = values[:first]
+            self._prices[offset:offset + rest] = values[first:]
+        self._head = (self._head + count) % capacity
+        self._count = min(self._count + count, capacity)
+        self._price_version += 1
+        for indicator in self._streaming_indicators:
+            indicator.extend(values)
+
+        logger.debug("Updated price history: %d candles", self._count)
 
     def update_price_history(self, new_prices: List[Decimal]):
         """Update price history with new data"""
-        if new_prices:
-            # Extend history with new prices
-            self.price_history.extend(new_prices)
+        self.add_prices(new_prices)
 
-            # Keep only the last max_history_length prices
-            if len(self.price_history) > self.max_history_length:
-                self.price_history = self.price_history[-self.max_history_length:]
-
-            logger.debug(
-                f"Updated price history: {len(self.price_history)} candles")
+    def add_streaming_indicator(self, indicator):
+        """
+        Register an indicator with add()/extend() methods to be fed every new
+        price, seeded with the current history.
+        """
+        indicator.extend(self.get_price_array())
+        self._streaming_indicators.append(indicator)
+        return indicator
 
     def has_sufficient_history(self) -> bool:
         """Check if we have enough price history for analysis"""
-        required = max(self.get_required_history(),
-                       self.config.min_history_required)
-        sufficient = len(self.price_history) >= required
+        required = self._history_threshold
+        if required is None:
+            required = self._history_threshold = max(
+                self.get_required_history(), self.config.min_history_required)
+        sufficient = self._count >= required
 
         if not sufficient:
             self.logger.debug(
-                f"Insufficient history: {len(self.price_history)}/{required}"
-            )
+                "Insufficient history: %d/%d", self._count, required)
 
         return sufficient
 
+    def invalidate_thresholds(self):
+        """Recompute required history on next check (call after changing parameters)"""
+        self._history_threshold = None
+
     def get_price_array(self) -> np.ndarray:
-        """Get price history as numpy array for calculations"""
-        return np.array([float(p) for p in self.price_history])
+        """
+        Get price history as numpy array for calculations (oldest first).
+        Returns a contiguous view of the ring buffer that later prices
+        overwrite - do not modify it, and .copy() it to keep it across ticks.
+        """
+        start = (self._head - self._count) % self._capacity
+        return self._prices[start:start + self._count]
+
+    async def _analyze_for_tick(self, current_price: Decimal, tick: Optional[Hashable]) -> TradingSignal:
+        """
+        analyze() memoized for one tick. Analysis can depend on time and
+        strategy state, not just prices, so a result is only reused for the
+        same caller-supplied tick id (e.g. the candle open time).
+        """
+        if tick is not None and self._last_analysis is not None \
+                and self._last_analysis[0] == tick:
+            return self._last_analysis[1]
 
-    async def should_buy(self, current_price: Decimal) -> TradingSignal:
-        """Check if strategy suggests buying"""
         signal = await self.analyze(current_price)
+        self._last_analysis = (tick, signal) if tick is not None else None
+        return signal
+
+    async def should_buy(self, current_price: Decimal, tick: Optional[Hashable] = None) -> TradingSignal:
+        """
+        Check if strategy suggests buying.
+        DEPRECATED: call analyze() once per tick and check signal.signal.
+        """
+        warnings.warn("should_buy is deprecated, use analyze()",
+                      DeprecationWarning, stacklevel=2)
+        signal = await self._analyze_for_tick(current_price, tick)
 
         if signal.signal == SignalType.BUY:
             self.logger.info(
@@ -150,9 +278,14 @@ class BaseStrategy(ABC):
 
         return signal
 
-    async def should_sell(self, current_price: Decimal) -> TradingSignal:
-        """Check if strategy suggests selling"""
-        signal = await self.analyze(current_price)
+    async def should_sell(self, current_price: Decimal, tick: Optional[Hashable] = None) -> TradingSignal:
+        """
+        Check if strategy suggests selling.
+        DEPRECATED: call analyze() once per tick and check signal.signal.
+        """
+        warnings.warn("should_sell is deprecated, use analyze()",
+                      DeprecationWarning, stacklevel=2)
+        signal = await self._analyze_for_tick(current_price, tick)
 
         if signal.signal == SignalType.SELL:
             self.logger.info(
@@ -163,22 +296,12 @@ class BaseStrategy(ABC):
         return signal
 
     def validate_config(self) -> bool:
-        """Validate strategy configuration"""
-        try:
-            if not self.config.symbol:
-                raise ValueError("Symbol is required")
-
-            if not self.config.timeframe:
-                raise ValueError("Timeframe is required")
-
-            if self.config.min_history_required < 1:
-                raise ValueError("Min history must be positive")
-
-            return True
-
-        except Exception as e:
-            self.logger.error(f"Config validation failed: {e}")
-            return False
+        """
+        Validate strategy configuration.
+        Base fields are checked in StrategyConfig.__post_init__, so this is a
+        hook for strategy-specific checks.
+        """
+        return True
 
     async def run(self):
         """
@@ -220,6 +343,13 @@ class BaseStrategy(ABC):
 
 
 # Strategy factory function (DEPRECATED - use StrategyFactory instead)
+# Legacy strategy name -> (module, class), imported lazily to avoid circular imports
+_STRATEGY_REGISTRY: Dict[str, Tuple[str, str]] = {
+    "grid": ("strategies.grid_strategy", "GridTradingStrategy"),
+    "dca": ("strategies.dca_strategy", "DCAStrategy"),
+}
+
+
 def create_strategy(strategy_name: str, config: StrategyConfig) -> BaseStrategy:
     """
     Factory function to create strategy instances.
@@ -228,15 +358,16 @@ def create_strategy(strategy_name: str, config: StrategyConfig) -> BaseStrategy:
     logger.warning(
         "create_strategy is deprecated. Use StrategyFactory for modular strategies.")
 
-    # Import strategies here to avoid circular imports
-    if strategy_name.lower() == "grid":
-        from strategies.grid_strategy import GridStrategy
-        return GridStrategy(config)
-
-    elif strategy_name.lower() == "dca":
-        from strategies.dca_strategy import DCAStrategy
-        return DCAStrategy(config)
-
-    else:
+    key = strategy_name.lower()
+    if key not in _STRATEGY_REGISTRY:
         raise ValueError(
             f"Unknown strategy: {strategy_name}. Use StrategyFactory for modular strategies.")
+
+    return _resolve_strategy_class(key)(config)
+
+
+@lru_cache(maxsize=None)
+def _resolve_strategy_class(key: str) -> type:
+    """Import strategy class on first use and remember it"""
+    module_name, class_name = _STRATEGY_REGISTRY[key]
+    return getattr(importlib.import_module(module_name), class_name)
@@ -1,8 +1,12 @@
 """
 Custom Strategy - TradingView style strategy builder with rules
 """
+import ast
+import asyncio
+import re
+import traceback
 from decimal import Decimal
-from typing import Dict, Any, List
+from typing import Callable, Dict, Any, List, Tuple
 from dataclasses import dataclass
 
 from .base_strategy import BaseStrategy, TradingSignal, SignalType, SignalStrength, StrategyConfig
@@ -12,6 +16,14 @@ from utils.logger import get_strategy_logger
 
 logger = get_strategy_logger()
 
+# Rule keywords -> Python boolean operators
+_RULE_KEYWORDS = re.compile(r'\b(AND|OR|NOT)\b')
+# Indicator.field references inside a condition
+_RULE_REFERENCE = re.compile(r'([A-Za-z_]\w*)\.([A-Za-z_]\w*)')
+
+# Compiled condition: takes resolve(indicator_name, field) -> bool
+RuleCondition = Callable[[Callable[[str, str], bool]], bool]
+
 
 @dataclass
 class StrategyRule:
@@ -22,6 +34,52 @@ class StrategyRule:
     strength: SignalStrength
 
 
+def _build_condition(node: ast.AST) -> RuleCondition:
+    """Turn a parsed condition into nested closures (and/or/not over Indicator.field)"""
+    if isinstance(node, ast.BoolOp):
+        parts = [_build_condition(value) for value in node.values]
+        if isinstance(node.op, ast.And):
+            return lambda resolve: all(part(resolve) for part in parts)
+        return lambda resolve: any(part(resolve) for part in parts)
+
+    if isinstance(node, ast.UnaryOp) and isinstance(node.op, ast.Not):
+        operand = _build_condition(node.operand)
+        return lambda resolve: not operand(resolve)
+
+    if isinstance(node, ast.Attribute) and isinstance(node.value, ast.Name):
+        indicator_name, field = node.value.id, node.attr
+        return lambda resolve: resolve(indicator_name, field)
+
+    if isinstance(node, ast.Constant) and isinstance(node.value, bool):
+        value = node.value
+        return lambda resolve: value
+
+    raise ValueError(f"Unsupported expression: {ast.unparse(node)}")
+
+
+def condition_references(condition: str) -> Tuple[Tuple[str, str], ...]:
+    """Unique (indicator_name, field) pairs referenced by a condition, in order"""
+    return tuple(dict.fromkeys(_RULE_REFERENCE.findall(condition)))
+
+
+def compile_condition(condition: str) -> RuleCondition:
+    """
+    Compile a rule condition string once, e.g.
+    "RSI.oversold AND (MACD.bullish OR NOT EMA.price_below_sell_threshold)".
+    Invalid conditions compile to a callable that raises when evaluated.
+    """
+    try:
+        expression = _RULE_KEYWORDS.sub(lambda m: m.group(1).lower(), condition)
+        return _build_condition(ast.parse(expression, mode='eval').body)
+    except (SyntaxError, ValueError) as e:
+        error = e
+        logger.warning(f"Invalid rule condition '{condition}': {error}")
+
+        def invalid(resolve):
+            raise error
+        return invalid
+
+
 class CustomStrategy(BaseStrategy):
     """Strategy builder that combines multiple indicators"""
 
@@ -43,6 +101,39 @@ class CustomStrategy(BaseStrategy):
         self.indicators = indicators
         self.rules = rules
         self.indicator_data = {}
+        self._indicator_data_version = -1  # price_version indicator_data was built from
+
+        # Parse every condition once instead of eval() on each tick
+        self._compiled_rules: List[Tuple[StrategyRule, RuleCondition]] = [
+            (rule, compile_condition(rule.condition)) for rule in rules
+        ]
+        self._rule_refs: Dict[str, Tuple[Tuple[str, str], ...]] = {
+            rule.name: condition_references(rule.condition) for rule in rules
+        }
+
+        indicator_names = {indicator.name for indicator in indicators}
+        for rule in rules:
+            unknown = {name for name, _ in self._rule_refs[rule.name]} - indicator_names
+            if unknown:
+                logger.warning(
+                    f"Rule '{rule.name}' references unknown indicators: {', '.join(sorted(unknown))}")
+
+        # Only indicators some rule refers to are calculated on each tick
+        used_names = {name for refs in self._rule_refs.values() for name, _ in refs}
+        self._active_indicators: List[BaseIndicator] = []
+        for indicator in indicators:
+            if indicator.name in used_names:
+                self._active_indicators.append(indicator)
+            else:
+                logger.debug(
+                    f"Indicator {indicator.name} is not referenced by any rule - skipping it")
+
+        # Indicators with a streaming form are updated per price instead of
+        # recomputed from the whole history
+        for indicator in self._active_indicators:
+            streaming = indicator.streaming_indicator()
+            if streaming is not None:
+                self.add_streaming_indicator(streaming)
 
         logger.info(
             f"Custom strategy created with {len(indicators)} indicators and {len(rules)} rules")
@@ -70,8 +161,17 @@ class CustomStrategy(BaseStrategy):
         await self._calculate_all_indicators()
 
         # Evaluate rules to find matching signal
-        for rule in self.rules:
-            if self._evaluate_rule_condition(rule.condition):
+        # References shared by several rules are resolved once per tick
+        resolved: Dict[Tuple[str, str], bool] = {}
+
+        def resolve(indicator_name: str, field: str) -> bool:
+            key = (indicator_name, field)
+            if key not in resolved:
+                resolved[key] = self._resolve_reference(indicator_name, field)
+            return resolved[key]
+
+        for rule, condition in self._compiled_rules:
+            if self._evaluate_rule_condition(rule, condition, resolve):
                 reason = self._build_reason_string(rule)
                 confidence = self._calculate_confidence(rule)
 
@@ -98,10 +198,16 @@ class CustomStrategy(BaseStrategy):
         )
 
     async def _calculate_all_indicators(self):
-        """Calculate values for all indicators"""
-        prices = self.price_history
+        """Calculate values for all indicators (skipped if prices are unchanged)"""
+        version = self.price_version
+        if self._indicator_data_version == version:
+            return
+
+        prices = self.get_price_array()
 
-        for indicator in self.indicators:
+        # Indicators are pure NumPy work with no await points - run them in
+        # turn; gathering them would only add task overhead per tick
+        for indicator in self._active_indicators:
             try:
                 indicator_result = await indicator.calculate(prices)
                 signal = indicator.get_signal(indicator_result, prices[-1])
@@ -120,61 +226,33 @@ class CustomStrategy(BaseStrategy):
                     'config': indicator.config
                 }
 
-    def _evaluate_rule_condition(self, condition: str) -> bool:
-        """Evaluate rule condition string"""
-        try:
-            # Replace indicator references with actual values
-            # Example: "RSI.oversold AND MACD.bullish AND SMA.price_above_buy_threshold"
-
-            evaluation_string = condition
-
-            # Create a list of all patterns to replace to avoid conflicts
-            replacements = []
-
-            # First pass: Collect all boolean data field replacements
-            for indicator_name, indicator_info in self.indicator_data.items():
-                data = indicator_info['data']
-
-                # Replace data field references - check all boolean fields in data
-                for key, value in data.items():
-                    if isinstance(value, bool):
-                        pattern = f"{indicator_name}.{key}"
-                        if pattern in evaluation_string:
-                            replacements.append((pattern, str(value)))
-
-            # Second pass: Collect signal references (bullish/bearish map to buy/sell)
-            for indicator_name, indicator_info in self.indicator_data.items():
-                signal = indicator_info['signal']
-
-                bullish_pattern = f"{indicator_name}.bullish"
-                bearish_pattern = f"{indicator_name}.bearish"
+        self._indicator_data_version = version
 
-                if bullish_pattern in evaluation_string:
-                    replacements.append(
-                        (bullish_pattern, str(signal == SignalType.BUY)))
-                if bearish_pattern in evaluation_string:
-                    replacements.append(
-                        (bearish_pattern, str(signal == SignalType.SELL)))
-
-            # Sort replacements by pattern length (longest first) to avoid partial replacements
-            replacements.sort(key=lambda x: len(x[0]), reverse=True)
-
-            # Apply all replacements
-            for pattern, replacement in replacements:
-                evaluation_string = evaluation_string.replace(
-                    pattern, replacement)
+    def _evaluate_rule_condition(self, rule: StrategyRule, condition: RuleCondition,
+                                 resolve: Callable[[str, str], bool] = None) -> bool:
+        """Evaluate compiled rule condition against current indicator data"""
+        try:
+            return bool(condition(resolve or self._resolve_reference))
+        except Exception as e:
+            logger.error(f"Error evaluating condition '{rule.condition}': {e}")
+            return False
 
-            # Replace logical operators
-            evaluation_string = evaluation_string.replace(" AND ", " and ")
-            evaluation_string = evaluation_string.replace(" OR ", " or ")
-            evaluation_string = evaluation_string.replace(" NOT ", " not ")
+    def _resolve_reference(self, indicator_name: str, field: str) -> bool:
+        """
+        Resolve Indicator.field - boolean data fields first, then
+        bullish/bearish mapped to the indicator's buy/sell signal
+        """
+        indicator_info = self.indicator_data[indicator_name]
 
-            # Safely evaluate the condition
-            return eval(evaluation_string)
+        value = indicator_info['data'].get(field)
+        if isinstance(value, bool):
+            return value
+        if field == 'bullish':
+            return indicator_info['signal'] == SignalType.BUY
+        if field == 'bearish':
+            return indicator_info['signal'] == SignalType.SELL
 
-        except Exception as e:
-            logger.error(f"Error evaluating condition '{condition}': {e}")
-            return False
+        raise ValueError(f"{indicator_name}.{field} is not a boolean condition")
 
     def _build_reason_string(self, rule: StrategyRule) -> str:
         """Build human-readable reason for signal"""
@@ -206,7 +284,7 @@ class CustomStrategy(BaseStrategy):
 
     def _calculate_confidence(self, rule: StrategyRule) -> float:
         """Calculate confidence based on how many indicators agree"""
-        total_indicators = len(self.indicators)
+        total_indicators = len(self._active_indicators) or 1
         agreeing_indicators = 0
 
         for indicator_info in self.indicator_data.values():
@@ -229,18 +307,20 @@ class CustomStrategy(BaseStrategy):
         logger.info(f"Starting {self.name} strategy for {self.config.symbol}")
 
         try:
-            # Get current price from market data
-            logger.info("Getting current price...")
-            current_price = await self.market_data.get_current_price(self.config.symbol)
+            # Get current price and historical data for indicators together
+            logger.info("Getting current price and historical kline data...")
+            current_price, klines = await asyncio.gather(
+                self.market_data.get_current_price(self.config.symbol),
+                self.market_data.get_klines(
+                    self.config.symbol, self.config.timeframe, 100)
+            )
             logger.info(f"Current price: {current_price}")
 
-            # Get historical data for indicators
-            logger.info("Getting historical kline data...")
-            klines = await self.market_data.get_klines(self.config.symbol, self.config.timeframe, 100)
-            if klines:
-                prices = [Decimal(str(kline['close'])) for kline in klines]
-                self.update_price_history(prices)
-                logger.info(f"Loaded {len(prices)} price candles")
+            if klines and len(klines['close']):
+                # Closes are already float64 - copy them straight into the buffer
+                closes = klines['close']
+                self.add_prices(closes)
+                logger.info(f"Loaded {len(closes)} price candles")
             else:
                 logger.warning("No kline data received")
                 return
@@ -264,6 +344,5 @@ class CustomStrategy(BaseStrategy):
 
         except Exception as e:
             logger.error(f"Error in strategy run: {e}")
-            import traceback
             logger.error(traceback.format_exc())
             raise
@@ -3,7 +3,9 @@
 DCA (Dollar Cost Averaging) Strategy - Risk reduction through position averaging.
 Automatically buys more when price drops to reduce average cost basis.
 """
+from collections import deque
 from decimal import Decimal
+from itertools import islice
 from typing import Dict, Any, List, Optional
 from dataclasses import dataclass
 from datetime import datetime, timedelta
@@ -43,6 +45,7 @@ class DCAConfig(StrategyConfig):
 
     def __post_init__(self):
         """Validate DCA configuration"""
+        super().__post_init__()
         if self.initial_buy_amount <= 0:
             raise ValueError("Initial buy amount must be positive")
         if self.dca_amount <= 0:
@@ -93,8 +96,12 @@ class DCAStrategy(BaseStrategy):
         self.dca_count: int = 0
 
         # Market analysis buffers
-        self.rsi_values = []
-        self.volume_buffer = []
+        self.rsi_values = deque(maxlen=10)
+        self.volume_buffer = deque(maxlen=20)
+
+        # Float copies of thresholds compared against float indicator values
+        self._rsi_oversold_threshold_f = float(config.rsi_oversold_threshold)
+        self._volume_spike_threshold_f = float(config.volume_spike_threshold)
 
         if not self.validate_config():
             raise ValueError("Invalid DCA strategy configuration")
@@ -153,26 +160,22 @@ class DCAStrategy(BaseStrategy):
 
     def _update_market_analysis(self, current_price: Decimal):
         """Update RSI and volume analysis"""
-        if len(self.price_history) < 14:
+        price_array = self.get_price_array()
+        if len(price_array) < 14:
             return
 
         # Calculate RSI
-        prices = np.array([float(p) for p in self.price_history[-14:]])
+        prices = price_array[-14:]
         if len(prices) >= 14:
             rsi = self._calculate_rsi(prices, 14)
             if len(rsi) > 0:
                 self.rsi_values.append(rsi[-1])
-                if len(self.rsi_values) > 10:
-                    self.rsi_values.pop(0)
 
         # Volume analysis would go here if we had volume data
         # For now, simulate volume analysis
-        if len(self.price_history) >= 20:
-            recent_volatility = np.std([float(p)
-                                       for p in self.price_history[-20:]])
+        if len(price_array) >= 20:
+            recent_volatility = np.std(price_array[-20:])
             self.volume_buffer.append(recent_volatility)
-            if len(self.volume_buffer) > 20:
-                self.volume_buffer.pop(0)
 
     def _update_position_metrics(self, current_price: Decimal):
         """Update position metrics and P&L"""
@@ -239,7 +242,7 @@ class DCAStrategy(BaseStrategy):
         # Check RSI oversold condition
         if self.rsi_values:
             current_rsi = self.rsi_values[-1]
-            if current_rsi > float(self.config.rsi_oversold_threshold):
+            if current_rsi > self._rsi_oversold_threshold_f:
                 return TradingSignal(
                     signal=SignalType.HOLD,
                     strength=SignalStrength.WEAK,
@@ -251,9 +254,10 @@ class DCAStrategy(BaseStrategy):
         # Check for volume spike (simulated)
         volume_condition = True
         if self.volume_buffer and len(self.volume_buffer) >= 10:
-            avg_volume = sum(self.volume_buffer[-10:]) / 10
+            avg_volume = sum(islice(self.volume_buffer,
+                                    len(self.volume_buffer) - 10, None)) / 10
             current_volume = self.volume_buffer[-1]
-            if current_volume < avg_volume * float(self.config.volume_spike_threshold):
+            if current_volume < avg_volume * self._volume_spike_threshold_f:
                 volume_condition = False
 
         if not volume_condition:
@@ -3,6 +3,7 @@
 Grid Trading Strategy - Profits from sideways market movements.
 Places buy/sell orders at fixed intervals to capture price oscillations.
 """
+from collections import deque
 from decimal import Decimal
 from typing import Dict, Any, List, Optional
 from dataclasses import dataclass
@@ -43,6 +44,7 @@ class GridConfig(StrategyConfig):
 
     def __post_init__(self):
         """Validate grid configuration"""
+        super().__post_init__()
         if self.grid_size < 3:
             raise ValueError("Grid size must be at least 3")
         if self.grid_spacing <= 0:
@@ -88,8 +90,12 @@ class GridTradingStrategy(BaseStrategy):
         self.max_drawdown_seen = Decimal('0')
 
         # Market analysis
-        self.volatility_buffer = []
-        self.trend_buffer = []
+        self.volatility_buffer = deque(maxlen=10)
+        self.trend_buffer = deque(maxlen=5)
+
+        # Float copies of thresholds compared against float market metrics
+        self._volatility_threshold_f = float(config.volatility_threshold)
+        self._max_trend_strength_f = float(config.max_trend_strength)
 
         if not self.validate_config():
             raise ValueError("Invalid grid strategy configuration")
@@ -149,30 +155,26 @@ class GridTradingStrategy(BaseStrategy):
 
     def _update_market_analysis(self, current_price: Decimal):
         """Update volatility and trend analysis"""
-        if len(self.price_history) < 2:
+        prices = self.get_price_array()
+        if len(prices) < 2:
             return
 
         # Calculate volatility (rolling standard deviation)
-        if len(self.price_history) >= 20:
-            recent_prices = np.array([float(p)
-                                     for p in self.price_history[-20:]])
+        if len(prices) >= 20:
+            recent_prices = prices[-20:]
             returns = np.diff(recent_prices) / recent_prices[:-1]
             volatility = np.std(returns)
 
             self.volatility_buffer.append(volatility)
-            if len(self.volatility_buffer) > 10:
-                self.volatility_buffer.pop(0)
 
         # Calculate trend strength
-        if len(self.price_history) >= self.config.trend_filter_period:
+        if len(prices) >= self.config.trend_filter_period:
             trend_period = self.config.trend_filter_period
-            start_price = self.price_history[-trend_period]
-            end_price = current_price
+            start_price = prices[-trend_period]
+            end_price = float(current_price)
             trend_strength = (end_price - start_price) / start_price
 
             self.trend_buffer.append(abs(trend_strength))
-            if len(self.trend_buffer) > 5:
-                self.trend_buffer.pop(0)
 
     def _check_market_conditions(self, current_price: Decimal) -> Dict[str, Any]:
         """Check if market conditions are suitable for grid trading"""
@@ -181,7 +183,7 @@ class GridTradingStrategy(BaseStrategy):
         if self.volatility_buffer:
             avg_volatility = sum(self.volatility_buffer) / \
                 len(self.volatility_buffer)
-            if avg_volatility < float(self.config.volatility_threshold):
+            if avg_volatility < self._volatility_threshold_f:
                 return {
                     'suitable': False,
                     'reason': f"Low volatility ({avg_volatility:.3f} < {self.config.volatility_threshold})"
@@ -190,7 +192,7 @@ class GridTradingStrategy(BaseStrategy):
         # Check trend strength
         if self.trend_buffer:
             avg_trend = sum(self.trend_buffer) / len(self.trend_buffer)
-            if avg_trend > float(self.config.max_trend_strength):
+            if avg_trend > self._max_trend_strength_f:
                 return {
                     'suitable': False,
                     'reason': f"Strong trend detected ({avg_trend:.3f} > {self.config.max_trend_strength})"
@@ -3,7 +3,7 @@ Base class for all technical indicators - TradingView style modular system
 """
 from abc import ABC, abstractmethod
 from decimal import Decimal
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Union
 from enum import Enum
 import numpy as np
 
@@ -43,9 +43,19 @@ class BaseIndicator(ABC):
         """Return minimum price history required"""
         pass
 
-    def to_numpy(self, prices: List[Decimal]) -> np.ndarray:
-        """Convert Decimal prices to numpy array"""
-        return np.array([float(p) for p in prices])
+    def streaming_indicator(self):
+        """
+        Optional object with add()/extend() methods that the strategy feeds
+        every new price (see BaseStrategy.add_streaming_indicator).
+        None means the indicator recomputes from the price history.
+        """
+        return None
+
+    def to_numpy(self, prices: Union[List[Decimal], np.ndarray]) -> np.ndarray:
+        """Convert Decimal prices to numpy array (float64 arrays pass through)"""
+        if isinstance(prices, np.ndarray):
+            return prices.astype(np.float64, copy=False)
+        return np.fromiter(map(float, prices), dtype=np.float64, count=len(prices))
 
     def get_config_summary(self) -> str:
         """Get human-readable config summary"""
@@ -38,20 +38,10 @@ class BollingerBands(BaseIndicator):
         period = self.config['period']
         std_multiplier = self.config['std_multiplier']
 
-        # Calculate Simple Moving Average (middle band)
-        sma_values = []
-        std_values = []
-
-        for i in range(period - 1, len(np_prices)):
-            window = np_prices[i - period + 1:i + 1]
-            sma_value = np.mean(window)
-            std_value = np.std(window, ddof=0)  # Population standard deviation
-
-            sma_values.append(sma_value)
-            std_values.append(std_value)
-
-        current_sma = sma_values[-1]
-        current_std = std_values[-1]
+        # Only the current bands are reported - compute the last window only
+        window = np_prices[-period:]
+        current_sma = np.mean(window)
+        current_std = np.std(window, ddof=0)  # Population standard deviation
         current_price = float(prices[-1])
 
         # Calculate bands
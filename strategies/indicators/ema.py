@@ -5,6 +5,7 @@ from decimal import Decimal
 from typing import Dict, Any, List
 import numpy as np
 from .base_indicator import BaseIndicator, SignalType
+from .kernels import ema as ema_kernel
 
 
 class EMA(BaseIndicator):
@@ -34,12 +35,7 @@ class EMA(BaseIndicator):
         period = self.config['period']
 
         # Calculate EMA
-        alpha = 2.0 / (period + 1)
-        ema = np.zeros_like(np_prices)
-        ema[0] = np_prices[0]
-
-        for i in range(1, len(np_prices)):
-            ema[i] = alpha * np_prices[i] + (1 - alpha) * ema[i-1]
+        ema = ema_kernel(np.ascontiguousarray(np_prices), period)
 
         current_ema = float(ema[-1])
         current_price = float(prices[-1])
@@ -0,0 +1,94 @@
+# strategies/indicators/kernels.py
+"""
+Numeric kernels for technical indicators.
+Compiled with Numba when available (see utils.jit); the compiled code is
+cached on disk so only the first process start pays for compilation.
+Kernels with an explicit signature compile at import time and expect
+C-contiguous float64 arrays.
+"""
+import numpy as np
+
+from utils.jit import njit
+
+
+@njit("float64[::1](float64[::1], int64)", cache=True)
+def ema(prices: np.ndarray, period: int) -> np.ndarray:
+    """
+    Exponential moving average seeded with the first price.
+
+    Returns:
+        Array of EMA values aligned with prices
+    """
+    alpha = 2.0 / (period + 1)
+    result = np.empty_like(prices)
+    if prices.shape[0] == 0:
+        return result
+    result[0] = prices[0]
+    for i in range(1, prices.shape[0]):
+        result[i] = alpha * prices[i] + (1.0 - alpha) * result[i - 1]
+    return result
+
+
+@njit("UniTuple(float64[::1], 2)(float64[::1], int64, int64, int64)", cache=True)
+def macd(prices: np.ndarray, fast_period: int, slow_period: int, signal_period: int):
+    """
+    MACD and signal lines in a single pass - the fast, slow and signal EMAs
+    are advanced together instead of three separate ema() passes.
+
+    Returns:
+        (macd_line, signal_line) aligned with prices
+    """
+    n = prices.shape[0]
+    macd_line = np.empty(n)
+    signal_line = np.empty(n)
+    if n == 0:
+        return macd_line, signal_line
+
+    fast_alpha = 2.0 / (fast_period + 1)
+    slow_alpha = 2.0 / (slow_period + 1)
+    signal_alpha = 2.0 / (signal_period + 1)
+    ema_fast = prices[0]
+    ema_slow = prices[0]
+    macd_line[0] = 0.0
+    signal_line[0] = 0.0
+    for i in range(1, n):
+        ema_fast = fast_alpha * prices[i] + (1.0 - fast_alpha) * ema_fast
+        ema_slow = slow_alpha * prices[i] + (1.0 - slow_alpha) * ema_slow
+        macd_line[i] = ema_fast - ema_slow
+        signal_line[i] = signal_alpha * macd_line[i] + \
+            (1.0 - signal_alpha) * signal_line[i - 1]
+    return macd_line, signal_line
+
+
+@njit("UniTuple(float64[::1], 2)(float64[::1], float64[::1], int64)", cache=True)
+def rsi_smooth(gains: np.ndarray, losses: np.ndarray, period: int):
+    """
+    Wilder smoothing of RSI gains and losses.
+
+    Returns:
+        (avg_gains, avg_losses) - zero before index period-1, which holds the
+        simple mean of the first period values
+    """
+    n = gains.shape[0]
+    avg_gains = np.zeros(n)
+    avg_losses = np.zeros(n)
+    if n < period:
+        return avg_gains, avg_losses
+
+    avg_gains[period - 1] = gains[:period].mean()
+    avg_losses[period - 1] = losses[:period].mean()
+    for i in range(period, n):
+        avg_gains[i] = (avg_gains[i - 1] * (period - 1) + gains[i]) / period
+        avg_losses[i] = (avg_losses[i - 1] * (period - 1) + losses[i]) / period
+    return avg_gains, avg_losses
+
+
+def warmup():
+    """
+    Run every kernel once on a tiny input, so the compiled code is loaded
+    (and the on-disk cache written) before the first live tick.
+    """
+    prices = np.linspace(1.0, 2.0, 4)
+    ema(prices, 2)
+    macd(prices, 1, 2, 2)
+    rsi_smooth(prices, prices, 2)
@@ -5,6 +5,7 @@ from decimal import Decimal
 from typing import Dict, Any, List
 import numpy as np
 from .base_indicator import BaseIndicator, SignalType
+from .kernels import macd as macd_kernel
 
 
 class MACD(BaseIndicator):
@@ -29,23 +30,15 @@ class MACD(BaseIndicator):
         slow_period = self.config['slow_period']
         signal_period = self.config['signal_period']
 
-        # Calculate EMAs
-        ema_fast = self._calculate_ema(np_prices, fast_period)
-        ema_slow = self._calculate_ema(np_prices, slow_period)
-
-        # MACD line
-        macd_line = ema_fast - ema_slow
-
-        # Signal line (EMA of MACD)
-        signal_line = self._calculate_ema(macd_line, signal_period)
-
-        # Histogram
-        histogram = macd_line - signal_line
+        # MACD and signal lines (EMA of MACD) in one fused pass
+        macd_line, signal_line = macd_kernel(
+            np.ascontiguousarray(np_prices, dtype=np.float64),
+            fast_period, slow_period, signal_period)
 
         return {
             'macd_line': float(macd_line[-1]),
             'signal_line': float(signal_line[-1]),
-            'histogram': float(histogram[-1]),
+            'histogram': float(macd_line[-1] - signal_line[-1]),
             'bullish_crossover': macd_line[-1] > signal_line[-1] and macd_line[-2] <= signal_line[-2],
             'bearish_crossover': macd_line[-1] < signal_line[-1] and macd_line[-2] >= signal_line[-2],
             'bullish': macd_line[-1] > signal_line[-1],
@@ -71,14 +64,3 @@ class MACD(BaseIndicator):
 
     def get_required_history_length(self) -> int:
         return self.config['slow_period'] + self.config['signal_period'] + 10
-
-    def _calculate_ema(self, prices: np.ndarray, period: int) -> np.ndarray:
-        """Calculate Exponential Moving Average"""
-        alpha = 2.0 / (period + 1)
-        ema = np.zeros_like(prices)
-        ema[0] = prices[0]
-
-        for i in range(1, len(prices)):
-            ema[i] = alpha * prices[i] + (1 - alpha) * ema[i-1]
-
-        return ema
@@ -5,6 +5,7 @@ from decimal import Decimal
 from typing import Dict, Any, List
 import numpy as np
 from .base_indicator import BaseIndicator, SignalType
+from .kernels import rsi_smooth
 
 
 class RSI(BaseIndicator):
@@ -29,21 +30,11 @@ class RSI(BaseIndicator):
 
         # Calculate price changes
         deltas = np.diff(np_prices)
-        gains = np.where(deltas > 0, deltas, 0)
-        losses = np.where(deltas < 0, -deltas, 0)
+        gains = np.maximum(deltas, 0.0)
+        losses = np.maximum(-deltas, 0.0)
 
-        # Calculate averages
-        avg_gains = np.zeros_like(gains)
-        avg_losses = np.zeros_like(losses)
-
-        # Initial averages
-        avg_gains[period-1] = np.mean(gains[:period])
-        avg_losses[period-1] = np.mean(losses[:period])
-
-        # Smooth the averages
-        for i in range(period, len(gains)):
-            avg_gains[i] = (avg_gains[i-1] * (period-1) + gains[i]) / period
-            avg_losses[i] = (avg_losses[i-1] * (period-1) + losses[i]) / period
+        # Smooth the averages (Wilder)
+        avg_gains, avg_losses = rsi_smooth(gains, losses, period)
 
         # Calculate RSI
         rs = avg_gains / (avg_losses + 1e-10)
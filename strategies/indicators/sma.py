@@ -1,12 +1,91 @@
+import math
+from collections import deque
 from decimal import Decimal
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional, Sequence
 import numpy as np
 from .base_indicator import BaseIndicator, SignalType
 
 
+class IncrementalSMA:
+    """
+    Streaming simple moving average - O(1) per price via a running sum.
+    Register with BaseStrategy.add_streaming_indicator to be fed every price.
+    The sum is recomputed exactly once per window so rounding can't drift.
+    """
+
+    __slots__ = ('period', '_window', '_sum', '_adds_since_resum', '_count')
+
+    def __init__(self, period: int):
+        if period < 1:
+            raise ValueError("SMA period must be positive")
+        self.period = period
+        self._window: deque = deque(maxlen=period)
+        self._sum = 0.0
+        self._adds_since_resum = 0
+        self._count = 0  # prices fed in total
+
+    @property
+    def value(self) -> Optional[float]:
+        """Current SMA, None until a full window has been seen"""
+        if len(self._window) < self.period:
+            return None
+        return self._sum / self.period
+
+    def add(self, price: float) -> Optional[float]:
+        """Add one price and return the updated SMA"""
+        if len(self._window) == self.period:
+            self._sum -= self._window[0]
+        self._window.append(price)
+        self._sum += price
+        self._count += 1
+
+        self._adds_since_resum += 1
+        if self._adds_since_resum >= self.period:
+            self._resum()
+        return self.value
+
+    def extend(self, prices: Sequence[float]) -> Optional[float]:
+        """Add a batch of prices; only the last window matters, so re-sum it"""
+        self._window.extend(prices)
+        self._count += len(prices)
+        self._resum()
+        return self.value
+
+    def matches(self, prices: Sequence) -> bool:
+        """
+        Whether prices look like the series fed here: no longer than what was
+        fed, with the same last price and the same price at the window start.
+        """
+        period = self.period
+        return (len(self._window) == period
+                and period <= len(prices) <= self._count
+                and float(prices[-1]) == self._window[-1]
+                and float(prices[-period]) == self._window[0])
+
+    def _resum(self):
+        """Replace the running sum with an exact sum of the window"""
+        self._sum = math.fsum(self._window)
+        self._adds_since_resum = 0
+
+
 class SMA(BaseIndicator):
     """Simple Moving Average indicator"""
 
+    def __init__(self, config: Dict[str, Any]):
+        super().__init__(config)
+        # Set once a strategy feeds this indicator every price
+        self._incremental: Optional[IncrementalSMA] = None
+
+    def streaming_indicator(self) -> IncrementalSMA:
+        """
+        Running SMA for the strategy to feed (see BaseStrategy.add_streaming_indicator).
+        Once requested, calculate() reads it instead of re-averaging the window
+        whenever the prices it is given match what the strategy fed.
+        """
+        if self._incremental is None:
+            self._incremental = IncrementalSMA(self.config['period'])
+        return self._incremental
+
     def validate_config(self) -> None:
         required = ['period']
         for key in required:
@@ -27,16 +106,12 @@ class SMA(BaseIndicator):
         if len(prices) < self.get_required_history_length():
             return {'value': float(prices[-1]), 'insufficient_data': True}
 
-        np_prices = self.to_numpy(prices)
-        period = self.config['period']
-
-        # Calculate Simple Moving Average
-        sma_values = []
-        for i in range(period - 1, len(np_prices)):
-            sma_value = np.mean(np_prices[i - period + 1:i + 1])
-            sma_values.append(sma_value)
-
-        current_sma = float(sma_values[-1])
+        # Fed incrementally by the strategy - O(1), otherwise average the last window
+        if self._incremental is not None and self._incremental.matches(prices):
+            current_sma = self._incremental.value
+        else:
+            period = self.config['period']
+            current_sma = float(np.mean(self.to_numpy(prices[-period:])))
         current_price = float(prices[-1])
 
         # Calculate buffer zones
@@ -340,3 +340,23 @@ class StrategyFactory:
         }
 
         return cls.create_custom_strategy(config, market_data)
+
+    @classmethod
+    def create_default_custom_strategy(cls, market_data: IMarketDataService) -> CustomStrategy:
+        """Create custom strategy from the stored RSI+MACD+EMA config"""
+        from .strategy_config import StrategyConfigs
+        return cls.create_custom_strategy(StrategyConfigs.get_rsi_macd_ema_config(), market_data)
+
+    @classmethod
+    def create_grid_strategy(cls, market_data: IMarketDataService,
+                             symbol: str = "BTCUSDT", timeframe: str = "1h"):
+        """Create grid trading strategy with default grid settings"""
+        from .grid_strategy import GridTradingStrategy, GridConfig
+        return GridTradingStrategy(GridConfig(symbol=symbol, timeframe=timeframe), market_data)
+
+    @classmethod
+    def create_dca_strategy(cls, market_data: IMarketDataService,
+                            symbol: str = "BTCUSDT", timeframe: str = "1h"):
+        """Create DCA strategy with default DCA settings"""
+        from .dca_strategy import DCAStrategy, DCAConfig
+        return DCAStrategy(DCAConfig(symbol=symbol, timeframe=timeframe), market_data)
@@ -0,0 +1,211 @@
+# tests/test_base_strategy.py
+"""
+Tests for BaseStrategy price history handling.
+"""
+from decimal import Decimal
+
+import pytest
+
+
+def _make_strategy(max_history_length=5):
+    from strategies.base_strategy import BaseStrategy, StrategyConfig
+
+    class _Strategy(BaseStrategy):
+        async def analyze(self, current_price):
+            return None
+
+        def get_required_history(self):
+            return 1
+
+    strategy = _Strategy(StrategyConfig(symbol="BTCUSDT", timeframe="1h"))
+    strategy.max_history_length = max_history_length
+    return strategy
+
+
+class TestPriceHistory:
+    """Test price history buffer and array view"""
+
+    def test_price_array_matches_history(self):
+        """Array view tracks appended prices"""
+        strategy = _make_strategy()
+
+        strategy.update_price_history([Decimal('1'), Decimal('2')])
+        strategy.add_price(Decimal('3.5'))
+
+        assert strategy.get_price_array().tolist() == [1.0, 2.0, 3.5]
+
+    def test_price_array_keeps_last_window(self):
+        """Only the last max_history_length prices are kept"""
+        strategy = _make_strategy(max_history_length=5)
+
+        for i in range(50):
+            strategy.add_price(Decimal(i))
+        strategy.update_price_history([Decimal('100'), Decimal('101')])
+
+        expected = [47.0, 48.0, 49.0, 100.0, 101.0]
+        assert strategy.get_price_array().tolist() == expected
+        assert strategy.price_history[-1] == Decimal('101.0')
+
+    def test_wrapped_array_is_contiguous_view(self):
+        """Wrapped history is returned as a view, without copying"""
+        import numpy as np
+        strategy = _make_strategy(max_history_length=3)
+        for i in range(4):
+            strategy.add_price(Decimal(i))
+        strategy.add_prices([Decimal('4'), Decimal('5')])
+
+        prices = strategy.get_price_array()
+
+        assert prices.tolist() == [3.0, 4.0, 5.0]
+        assert prices.flags.c_contiguous
+        assert np.shares_memory(prices, strategy._prices)
+
+    def test_add_prices_matches_add_price(self):
+        """A batch update leaves the same history as per-tick updates"""
+        batched = _make_strategy(max_history_length=4)
+        single = _make_strategy(max_history_length=4)
+        prices = [Decimal(i) / 2 for i in range(7)]
+
+        batched.add_prices(prices[:2])
+        batched.add_prices(prices[2:])
+        for price in prices:
+            single.add_price(price)
+
+        assert batched.get_price_array().tolist() == single.get_price_array().tolist()
+
+    def test_add_prices_accepts_float_array(self):
+        """Float64 arrays are stored as-is, without the Decimal round-trip"""
+        import numpy as np
+        strategy = _make_strategy(max_history_length=3)
+
+        strategy.add_prices(np.array([1.5, 2.5, 3.5, 4.5]))
+        strategy.add_prices(np.array([], dtype=np.float64))
+
+        assert strategy.get_price_array().tolist() == [2.5, 3.5, 4.5]
+
+    def test_empty_history(self):
+        """No prices yields an empty array"""
+        strategy = _make_strategy()
+
+        assert len(strategy.get_price_array()) == 0
+
+    def test_shrinking_history_keeps_recent_prices(self):
+        """Resizing the buffer keeps the newest prices in order"""
+        strategy = _make_strategy(max_history_length=4)
+
+        strategy.update_price_history([Decimal(i) for i in range(6)])
+        strategy.max_history_length = 2
+
+        assert strategy.get_price_array().tolist() == [4.0, 5.0]
+        strategy.add_price(Decimal('6'))
+        assert strategy.get_price_array().tolist() == [5.0, 6.0]
+
+    def test_history_threshold_invalidation(self):
+        """Changed requirements are picked up after invalidate_thresholds"""
+        strategy = _make_strategy()
+        strategy.update_price_history([Decimal('1'), Decimal('2')])
+
+        assert not strategy.has_sufficient_history()
+        strategy.config.min_history_required = 2
+        assert not strategy.has_sufficient_history()  # Cached threshold
+        strategy.invalidate_thresholds()
+        assert strategy.has_sufficient_history()
+
+    def test_streaming_sma_tracks_history(self):
+        """Registered IncrementalSMA is seeded and fed every new price"""
+        from strategies.indicators.sma import IncrementalSMA
+
+        strategy = _make_strategy(max_history_length=10)
+        strategy.update_price_history([Decimal(i) for i in range(1, 5)])
+        sma = strategy.add_streaming_indicator(IncrementalSMA(3))
+
+        assert sma.value == 3.0  # (2 + 3 + 4) / 3
+        strategy.add_price(Decimal('8'))
+        assert sma.value == 5.0  # (3 + 4 + 8) / 3
+        strategy.update_price_history([Decimal('1'), Decimal('2'), Decimal('3')])
+        assert sma.value == 2.0
+        assert sma.value == float(strategy.get_price_array()[-3:].mean())
+
+    def test_streaming_sma_does_not_drift(self):
+        """The running sum is re-summed each window, so it stays exact"""
+        import math
+        from strategies.indicators.sma import IncrementalSMA
+
+        sma = IncrementalSMA(4)
+        values = [1e8 + 0.1 * (i % 7) if i % 2 else 0.1 * i for i in range(10001)]
+        for value in values:
+            sma.add(value)
+
+        assert sma.value == math.fsum(values[-4:]) / 4
+
+
+class TestShouldBuySell:
+    """Test deprecated should_buy/should_sell helpers"""
+
+    def _counting_strategy(self, calls):
+        from strategies.base_strategy import (
+            TradingSignal, SignalType, SignalStrength)
+        strategy = _make_strategy()
+
+        async def analyze(current_price):
+            calls.append(current_price)
+            return TradingSignal(SignalType.HOLD, SignalStrength.WEAK,
+                                 current_price, "test", 0.5)
+        strategy.analyze = analyze
+        return strategy
+
+    def test_both_directions_analyze_once_per_tick(self):
+        """Checking buy and sell for the same tick id runs analyze once"""
+        import asyncio
+        calls = []
+        strategy = self._counting_strategy(calls)
+
+        async def check(tick):
+            await strategy.should_buy(Decimal('100'), tick=tick)
+            await strategy.should_sell(Decimal('100'), tick=tick)
+
+        with pytest.warns(DeprecationWarning):
+            asyncio.run(check(1))
+            assert len(calls) == 1
+            asyncio.run(check(2))  # Same price and history, next tick
+            assert len(calls) == 2
+
+    def test_no_reuse_without_tick(self):
+        """Without a tick id every call analyzes afresh"""
+        import asyncio
+        calls = []
+        strategy = self._counting_strategy(calls)
+
+        async def check():
+            await strategy.should_buy(Decimal('100'))
+            await strategy.should_sell(Decimal('100'))
+
+        with pytest.warns(DeprecationWarning):
+            asyncio.run(check())
+        assert len(calls) == 2
+
+
+class TestStrategyConfig:
+    """Test strategy config validation"""
+
+    def test_missing_symbol_rejected(self):
+        """Config without a symbol fails at construction"""
+        from strategies.base_strategy import StrategyConfig
+
+        with pytest.raises(ValueError):
+            StrategyConfig(symbol="", timeframe="1h")
+
+    def test_invalid_min_history_rejected(self):
+        """Non-positive min history fails at construction"""
+        from strategies.base_strategy import StrategyConfig
+
+        with pytest.raises(ValueError):
+            StrategyConfig(symbol="BTCUSDT", timeframe="1h",
+                           min_history_required=0)
+
+    def test_subclass_runs_base_validation(self):
+        """Strategy-specific configs also validate base fields"""
+        from strategies.grid_strategy import GridConfig
+
+        with pytest.raises(ValueError):
+            GridConfig(symbol="BTCUSDT", timeframe="")
@@ -0,0 +1,190 @@
+# tests/test_custom_strategy.py
+"""
+Tests for CustomStrategy rule compilation and evaluation.
+"""
+
+
+def _resolver(values):
+    def resolve(indicator_name, field):
+        return values[f"{indicator_name}.{field}"]
+    return resolve
+
+
+class TestRuleConditions:
+    """Test compiled rule conditions"""
+
+    def test_and_or_not(self):
+        """Keywords map to boolean operators with normal precedence"""
+        from strategies.custom_strategy import compile_condition
+
+        condition = compile_condition(
+            "RSI.oversold AND MACD.bullish OR NOT EMA.price_above_buy_threshold")
+        values = {
+            "RSI.oversold": True,
+            "MACD.bullish": False,
+            "EMA.price_above_buy_threshold": False,
+        }
+
+        assert condition(_resolver(values)) is True
+        values["EMA.price_above_buy_threshold"] = True
+        assert condition(_resolver(values)) is False
+
+    def test_short_circuit(self):
+        """Later references are not resolved once the result is known"""
+        from strategies.custom_strategy import compile_condition
+
+        condition = compile_condition("RSI.oversold AND MACD.bullish")
+
+        assert condition(_resolver({"RSI.oversold": False})) is False
+
+    def test_invalid_condition_raises_on_evaluation(self):
+        """Arbitrary expressions are rejected instead of executed"""
+        import pytest
+        from strategies.custom_strategy import compile_condition
+
+        condition = compile_condition("__import__('os').getcwd()")
+
+        with pytest.raises(ValueError):
+            condition(_resolver({}))
+
+    def test_condition_references(self):
+        """References are extracted once, without duplicates"""
+        from strategies.custom_strategy import condition_references
+
+        refs = condition_references("RSI.oversold AND MACD.bullish OR RSI.oversold")
+
+        assert refs == (("RSI", "oversold"), ("MACD", "bullish"))
+
+
+class TestIndicatorCache:
+    """Test indicator results are reused between unchanged ticks"""
+
+    async def _analyze_twice(self, strategy):
+        from decimal import Decimal
+        await strategy.analyze(Decimal('100'))
+        await strategy.analyze(Decimal('100'))
+
+    def test_indicators_recomputed_only_on_new_prices(self):
+        """Indicators are recalculated once per price history change"""
+        import asyncio
+        from decimal import Decimal
+        from strategies.custom_strategy import CustomStrategy, StrategyRule
+        from strategies.base_strategy import SignalType, SignalStrength
+        from strategies.indicators.rsi import RSI
+
+        calls = []
+
+        class CountingRSI(RSI):
+            async def calculate(self, prices):
+                calls.append(len(prices))
+                return await super().calculate(prices)
+
+        rsi = CountingRSI(
+            {'period': 5, 'oversold_threshold': 30, 'overbought_threshold': 70})
+        rsi.name = 'RSI'
+        strategy = CustomStrategy(
+            {'min_history_required': 20}, None, [rsi],
+            [StrategyRule('buy', 'RSI.oversold', SignalType.BUY, SignalStrength.STRONG)])
+        strategy.update_price_history([Decimal(100 + i % 7) for i in range(30)])
+
+        asyncio.run(self._analyze_twice(strategy))
+        assert len(calls) == 1
+
+        strategy.add_price(Decimal('99'))
+        asyncio.run(self._analyze_twice(strategy))
+        assert len(calls) == 2
+
+    def test_unreferenced_indicators_skipped(self):
+        """Indicators no rule refers to are not calculated"""
+        import asyncio
+        from decimal import Decimal
+        from strategies.custom_strategy import CustomStrategy, StrategyRule
+        from strategies.base_strategy import SignalType, SignalStrength
+        from strategies.indicators.rsi import RSI
+        from strategies.indicators.macd import MACD
+
+        macd = MACD({'fast_period': 3, 'slow_period': 6, 'signal_period': 3})
+
+        async def fail(prices):
+            raise AssertionError("unused indicator calculated")
+        macd.calculate = fail
+
+        rsi = RSI({'period': 5, 'oversold_threshold': 30, 'overbought_threshold': 70})
+        strategy = CustomStrategy(
+            {'min_history_required': 20}, None, [rsi, macd],
+            [StrategyRule('buy', 'RSI.oversold', SignalType.BUY, SignalStrength.STRONG)])
+        strategy.update_price_history([Decimal(100 + i % 7) for i in range(30)])
+
+        asyncio.run(strategy.analyze(Decimal('100')))
+        assert set(strategy.indicator_data) == {'RSI'}
+
+    def test_failing_indicator_does_not_block_others(self):
+        """An indicator error is recorded while the others still calculate"""
+        import asyncio
+        from decimal import Decimal
+        from strategies.custom_strategy import CustomStrategy, StrategyRule
+        from strategies.base_strategy import SignalType, SignalStrength
+        from strategies.indicators.rsi import RSI
+        from strategies.indicators.ema import EMA
+
+        ema = EMA({'period': 5, 'buy_buffer_percent': 0.1, 'sell_buffer_percent': 0.1})
+
+        async def fail(prices):
+            raise RuntimeError("boom")
+        ema.calculate = fail
+
+        rsi = RSI({'period': 5, 'oversold_threshold': 30, 'overbought_threshold': 70})
+        strategy = CustomStrategy(
+            {'min_history_required': 20}, None, [ema, rsi],
+            [StrategyRule('buy', 'RSI.oversold OR EMA.price_above_buy_threshold',
+                          SignalType.BUY, SignalStrength.STRONG)])
+        strategy.update_price_history([Decimal(100 + i % 7) for i in range(30)])
+
+        asyncio.run(strategy._calculate_all_indicators())
+        assert strategy.indicator_data['EMA']['data'] == {'error': 'boom'}
+        assert 'value' in strategy.indicator_data['RSI']['data']
+
+    def test_sma_fed_incrementally(self):
+        """SMA is registered as a streaming indicator and matches the window mean"""
+        import asyncio
+        from decimal import Decimal
+        from strategies.custom_strategy import CustomStrategy, StrategyRule
+        from strategies.base_strategy import SignalType, SignalStrength
+        from strategies.indicators.sma import SMA
+
+        sma = SMA({'period': 5})
+        strategy = CustomStrategy(
+            {'min_history_required': 10}, None, [sma],
+            [StrategyRule('buy', 'SMA.price_above_sma', SignalType.BUY, SignalStrength.STRONG)])
+        strategy.update_price_history([Decimal(100 + i % 7) for i in range(30)])
+        strategy.add_price(Decimal('120'))
+
+        assert strategy._streaming_indicators == [sma.streaming_indicator()]
+        asyncio.run(strategy._calculate_all_indicators())
+        expected = float(strategy.get_price_array()[-5:].mean())
+        assert abs(strategy.indicator_data['SMA']['data']['value'] - expected) < 1e-9
+        assert sma.streaming_indicator().matches(strategy.get_price_array())
+
+    def test_sma_other_series_not_streamed(self):
+        """SMA given a different series after streaming starts averages that series"""
+        import asyncio
+        import numpy as np
+        from decimal import Decimal
+        from strategies.custom_strategy import CustomStrategy, StrategyRule
+        from strategies.base_strategy import SignalType, SignalStrength
+        from strategies.indicators.sma import SMA
+
+        sma = SMA({'period': 5})
+        strategy = CustomStrategy(
+            {'min_history_required': 10}, None, [sma],
+            [StrategyRule('buy', 'SMA.price_above_sma', SignalType.BUY, SignalStrength.STRONG)])
+        strategy.update_price_history([Decimal(100 + i % 7) for i in range(30)])
+
+        other = np.linspace(10.0, 40.0, 30)
+        data = asyncio.run(sma.calculate(other))
+        assert data['value'] == float(np.mean(other[-5:]))
+
+        # Same last price but a different window is not taken for the stream
+        other[-1] = strategy.get_price_array()[-1]
+        data = asyncio.run(sma.calculate(other))
+        assert data['value'] == float(np.mean(other[-5:]))
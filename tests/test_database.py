@@ -0,0 +1,65 @@
+# tests/test_database.py
+"""
+Tests for database connection helpers (in-memory SQLite).
+"""
+import pytest
+
+MEMORY_URL = "sqlite+aiosqlite:///:memory:"
+
+
+async def _index_names():
+    from database.connection import execute_raw_sql
+    result = await execute_raw_sql(
+        "SELECT name FROM sqlite_master WHERE type = 'index' AND tbl_name = 'trades'")
+    return {row[0] for row in result}
+
+
+class TestIndexes:
+    """Test model indexes on new and existing databases"""
+
+    @pytest.mark.asyncio
+    async def test_missing_indexes_created_without_dropping_data(self):
+        """Indexes missing from an existing table are added, rows are kept"""
+        from database import connection
+        from database.connection import init_database, execute_raw_sql, close_database
+
+        await init_database(MEMORY_URL)
+        try:
+            assert 'ix_trades_symbol_created' in await _index_names()
+
+            await execute_raw_sql("DROP INDEX ix_trades_symbol_created")
+            await execute_raw_sql(
+                "INSERT INTO system_logs (level, message) VALUES ('INFO', 'kept')")
+
+            async with connection.engine.begin() as conn:
+                await conn.run_sync(connection._create_missing_indexes)
+
+            assert 'ix_trades_symbol_created' in await _index_names()
+            result = await execute_raw_sql("SELECT COUNT(*) FROM system_logs")
+            assert result.scalar() == 1
+        finally:
+            await close_database()
+
+
+class TestBulkInsert:
+    """Test bulk_insert against the in-memory StaticPool engine"""
+
+    @pytest.mark.asyncio
+    async def test_rows_inserted_in_one_call(self):
+        """All rows are written and the row count is returned"""
+        from database.connection import (
+            init_database, bulk_insert, execute_raw_sql, close_database)
+        from database.models import SystemLog
+
+        await init_database(MEMORY_URL)
+        try:
+            rows = [{'level': 'INFO', 'message': f'event {i}'} for i in range(5)]
+
+            assert await bulk_insert(SystemLog, rows) == 5
+            assert await bulk_insert(SystemLog, []) == 0
+
+            result = await execute_raw_sql(
+                "SELECT message FROM system_logs ORDER BY id")
+            assert [row[0] for row in result] == [row['message'] for row in rows]
+        finally:
+            await close_database()
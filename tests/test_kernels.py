@@ -0,0 +1,70 @@
+# tests/test_kernels.py
+"""
+Tests for numeric kernels (run with or without numba installed).
+"""
+import numpy as np
+
+
+class TestCoreKernels:
+    """Test trading core kernels"""
+
+    def test_ohlcv_reduce(self):
+        """High/low/volume/open reduction matches NumPy"""
+        from core.kernels import ohlcv_reduce
+
+        high, low, volume, first_open = ohlcv_reduce(
+            np.array([100.0, 104.0, 108.0]),
+            np.array([105.0, 110.0, 109.0]),
+            np.array([99.0, 101.0, 95.0]),
+            np.array([10.0, 5.5, 2.5]))
+
+        assert high == 110.0
+        assert low == 95.0
+        assert volume == 18.0
+        assert first_open == 100.0
+
+
+class TestIndicatorKernels:
+    """Test technical indicator kernels"""
+
+    def test_ema_matches_recurrence(self):
+        """EMA kernel follows the seeded recurrence"""
+        from strategies.indicators.kernels import ema
+
+        prices = np.array([10.0, 11.0, 12.0, 11.0, 13.0])
+        result = ema(prices, 3)
+
+        expected = [10.0]
+        for price in prices[1:]:
+            expected.append(0.5 * price + 0.5 * expected[-1])
+        assert np.allclose(result, expected)
+
+    def test_ema_empty(self):
+        """Empty input yields empty output"""
+        from strategies.indicators.kernels import ema
+
+        assert len(ema(np.zeros(0), 3)) == 0
+
+    def test_rsi_smooth_matches_wilder(self):
+        """RSI smoothing seeds with the mean and applies Wilder's recurrence"""
+        from strategies.indicators.kernels import rsi_smooth
+
+        gains = np.array([1.0, 0.0, 2.0, 0.0, 1.0])
+        losses = np.array([0.0, 1.0, 0.0, 3.0, 0.0])
+        avg_gains, avg_losses = rsi_smooth(gains, losses, 3)
+
+        assert avg_gains[0] == 0.0 and avg_gains[1] == 0.0
+        assert avg_gains[2] == 1.0
+        assert abs(avg_gains[3] - 2.0 / 3.0) < 1e-12
+        assert abs(avg_losses[4] - (((1.0 / 3.0) * 2 + 3.0) / 3 * 2) / 3) < 1e-12
+
+    def test_macd_matches_separate_emas(self):
+        """Fused MACD kernel equals the three-pass EMA computation"""
+        from strategies.indicators.kernels import ema, macd
+
+        prices = np.array([10.0, 11.0, 12.5, 11.0, 13.0, 12.0, 14.0, 13.5])
+        macd_line, signal_line = macd(prices, 2, 4, 3)
+
+        expected_macd = ema(prices, 2) - ema(prices, 4)
+        assert np.allclose(macd_line, expected_macd)
+        assert np.allclose(signal_line, ema(expected_macd, 3))
@@ -0,0 +1,61 @@
+# tests/test_main.py
+"""
+Tests for the main entry point helpers.
+"""
+import asyncio
+import pytest
+from unittest.mock import AsyncMock, Mock
+
+
+class TestPortfolioProbe:
+    """Test the portfolio probe loop"""
+
+    @pytest.mark.asyncio
+    async def test_backoff_grows_while_engine_fails(self, monkeypatch):
+        """Failed status checks retry with growing delays"""
+        import main
+
+        engine = Mock()
+        engine.get_portfolio_status = AsyncMock(side_effect=RuntimeError("API down"))
+        shutdown_event = asyncio.Event()
+        delays = []
+
+        async def fake_wait_for(awaitable, timeout):
+            awaitable.close()
+            delays.append(timeout)
+            if len(delays) == 4:
+                shutdown_event.set()
+            raise asyncio.TimeoutError
+
+        monkeypatch.setattr(main, "trading_engine", engine)
+        monkeypatch.setattr(main, "shutdown_event", shutdown_event)
+        monkeypatch.setattr(main.random, "random", lambda: 0.0)
+        monkeypatch.setattr(main.asyncio, "wait_for", fake_wait_for)
+
+        await main._portfolio_probe_loop()
+
+        assert delays == [1.0, 2.0, 4.0, 8.0]
+
+    @pytest.mark.asyncio
+    async def test_interval_after_success(self, monkeypatch):
+        """Successful status checks wait the regular interval"""
+        import main
+
+        engine = Mock()
+        engine.get_portfolio_status = AsyncMock(return_value={})
+        shutdown_event = asyncio.Event()
+        delays = []
+
+        async def fake_wait_for(awaitable, timeout):
+            awaitable.close()
+            delays.append(timeout)
+            shutdown_event.set()
+            raise asyncio.TimeoutError
+
+        monkeypatch.setattr(main, "trading_engine", engine)
+        monkeypatch.setattr(main, "shutdown_event", shutdown_event)
+        monkeypatch.setattr(main.asyncio, "wait_for", fake_wait_for)
+
+        await main._portfolio_probe_loop()
+
+        assert delays == [main.PORTFOLIO_PROBE_INTERVAL]
@@ -0,0 +1,29 @@
+# tests/test_market_data_service.py
+"""
+Tests for MarketDataService kline conversion.
+"""
+import pytest
+from unittest.mock import AsyncMock
+
+
+class TestKlines:
+    """Test klines are returned column-oriented"""
+
+    @pytest.mark.asyncio
+    async def test_klines_are_column_arrays(self):
+        """Each field becomes one contiguous NumPy column"""
+        from core.services.market_data_service import MarketDataService
+
+        client = AsyncMock()
+        client.get_klines.return_value = [
+            [1000, "100.5", "101", "99", "100.8", "12.5", 1999, "1250", 42, "6", "600", "0"],
+            [2000, "100.8", "102", "100", "101.9", "8", 2999, "810", 17, "4", "405", "0"],
+        ]
+        market_data = MarketDataService(client)
+
+        klines = await market_data.get_klines("BTCUSDT", "1h", 2)
+
+        assert klines['close'].tolist() == [100.8, 101.9]
+        assert klines['high'].flags['C_CONTIGUOUS']
+        assert klines['open_time'].tolist() == [1000, 2000]
+        assert klines['trades_count'].dtype.kind == 'i'
@@ -0,0 +1,46 @@
+# tests/test_order_service.py
+"""
+Tests for OrderService fill handling.
+"""
+from decimal import Decimal
+
+
+class TestFillSummary:
+    """Test executed quantity and price are derived from all fills"""
+
+    def test_volume_weighted_price(self):
+        """Average price is weighted by fill quantity"""
+        from core.services.order_service import _summarize_fills
+
+        response = {
+            'executedQty': '0.30000000',
+            'fills': [
+                {'price': '50000.00', 'qty': '0.10000000', 'commission': '0.0001'},
+                {'price': '50300.00', 'qty': '0.20000000', 'commission': '0.0002'},
+            ]
+        }
+
+        qty, price = _summarize_fills(response, Decimal('0.3'), Decimal('49000'))
+
+        assert qty == Decimal('0.3')
+        assert price == Decimal('50200')
+
+    def test_missing_fills_fall_back_to_request(self):
+        """Requested quantity/price are used when the response has no fills"""
+        from core.services.order_service import _summarize_fills
+
+        qty, price = _summarize_fills({}, Decimal('0.5'), Decimal('49000'))
+
+        assert qty == Decimal('0.5')
+        assert price == Decimal('49000')
+
+    def test_many_fills_stay_exact(self):
+        """Long fill lists are summed exactly in Decimal"""
+        from core.services.order_service import _summarize_fills
+
+        fills = [{'price': str(50000 + i), 'qty': '0.01000001'} for i in range(10)]
+
+        qty, price = _summarize_fills({'fills': fills}, Decimal('1'), Decimal('1'))
+
+        assert qty == Decimal('0.1000001')
+        assert price == Decimal('50004.5')
@@ -0,0 +1,119 @@
+# tests/test_portfolio_service.py
+"""
+Tests for PortfolioService account snapshot caching.
+"""
+import pytest
+from decimal import Decimal
+from unittest.mock import AsyncMock
+
+
+def _client():
+    client = AsyncMock()
+    client.get_account.return_value = {
+        'balances': [
+            {'asset': 'BTC', 'free': '0.5', 'locked': '0.1'},
+            {'asset': 'ETH', 'free': '0.0', 'locked': '0.0'},
+            {'asset': 'USDT', 'free': '1234.5', 'locked': '10'},
+        ]
+    }
+    return client
+
+
+class TestPortfolioCache:
+    """Test positions and balances share one cached account snapshot"""
+
+    @pytest.mark.asyncio
+    async def test_balance_and_positions_share_one_fetch(self):
+        """Balance lookup after position lookup does not refetch account"""
+        from core.services.portfolio_service import PortfolioService
+
+        client = _client()
+        portfolio = PortfolioService(client)
+
+        position = await portfolio.get_position("BTCUSDT")
+        balance = await portfolio.get_account_balance()
+
+        assert position.quantity == Decimal("0.6")
+        assert balance == Decimal("1234.5")
+        assert client.get_account.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_missing_symbol_served_from_cache(self):
+        """Unheld symbols do not trigger a refresh while cache is valid"""
+        from core.services.portfolio_service import PortfolioService
+
+        client = _client()
+        portfolio = PortfolioService(client)
+
+        assert await portfolio.get_position("BTCUSDT") is not None
+        assert await portfolio.get_position("ETHUSDT") is None
+        assert await portfolio.get_position("SOLUSDT") is None
+        assert client.get_account.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_snapshot_returns_balance_and_position(self):
+        """get_snapshot returns both values from one account fetch"""
+        from core.services.portfolio_service import PortfolioService
+
+        client = _client()
+        portfolio = PortfolioService(client)
+
+        balance, position = await portfolio.get_snapshot("BTCUSDT")
+
+        assert balance == Decimal("1234.5")
+        assert position.quantity == Decimal("0.6")
+        assert client.get_account.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_invalidate_cache_forces_refresh(self):
+        """invalidate_cache drops the snapshot"""
+        from core.services.portfolio_service import PortfolioService
+
+        client = _client()
+        portfolio = PortfolioService(client)
+
+        await portfolio.get_account_balance()
+        portfolio.invalidate_cache()
+        await portfolio.get_account_balance()
+
+        assert client.get_account.await_count == 2
+
+
+class TestPortfolioValuation:
+    """Test total portfolio value calculation"""
+
+    @pytest.mark.asyncio
+    async def test_total_value_includes_positions(self):
+        """Total value is USDT balance plus priced positions"""
+        from core.services.portfolio_service import PortfolioService
+
+        client = _client()
+        client.get_ticker_price.return_value = {'price': '50000'}
+        portfolio = PortfolioService(client)
+
+        total = await portfolio.get_total_portfolio_value()
+
+        assert total == Decimal("1234.5") + Decimal("0.6") * Decimal("50000")
+
+    @pytest.mark.asyncio
+    async def test_failed_price_is_skipped(self):
+        """Positions without a price are left out of the total"""
+        from core.services.portfolio_service import PortfolioService
+
+        client = _client()
+        client.get_ticker_price.side_effect = RuntimeError("timeout")
+        portfolio = PortfolioService(client)
+
+        assert await portfolio.get_total_portfolio_value() == Decimal("1234.5")
+
+    def test_position_values_are_exact(self):
+        """Totals keep full Decimal precision at any magnitude"""
+        from core.services.portfolio_service import PortfolioService
+
+        quantities = [Decimal("1000000.00000001"), Decimal("3"),
+                      Decimal("12.34567891")]
+        prices = [Decimal("1000"), Decimal("0.00000001"),
+                  Decimal("47295.32874285")]
+
+        assert PortfolioService._sum_position_values(quantities, prices) == \
+            Decimal("1000583892.9426121500582935")
@@ -0,0 +1,137 @@
+# tests/test_risk_service.py
+"""
+Tests for RiskService limit checks and scaled-integer arithmetic.
+"""
+import pytest
+from decimal import Decimal
+from unittest.mock import AsyncMock
+
+from core.interfaces.trading_interfaces import PositionData
+
+
+def _portfolio(balance=Decimal("1000"), position=None):
+    portfolio = AsyncMock()
+    portfolio.get_account_balance.return_value = balance
+    portfolio.get_position.return_value = position
+    portfolio.get_snapshot.return_value = (balance, position)
+    return portfolio
+
+
+class TestRiskServiceBuy:
+    """Test buy order validation"""
+
+    @pytest.mark.asyncio
+    async def test_trade_exactly_at_limit_is_approved(self):
+        """Trade value equal to max trade size passes with full risk score"""
+        from core.services.risk_service import RiskService
+
+        risk = RiskService(max_trade_size=Decimal("100"),
+                           portfolio_service=_portfolio())
+        result = await risk.validate_buy_order("BTCUSDT", Decimal("0.002"), Decimal("50000"))
+
+        assert result.approved
+        assert result.risk_score == Decimal("1")
+
+    @pytest.mark.asyncio
+    async def test_trade_over_limit_is_rejected(self):
+        """Trade value above max trade size by one unit is rejected"""
+        from core.services.risk_service import RiskService
+
+        risk = RiskService(max_trade_size=Decimal("100"))
+        result = await risk.validate_buy_order("BTCUSDT", Decimal("0.00200001"), Decimal("50000"))
+
+        assert not result.approved
+        assert result.risk_score == Decimal("1.0")
+
+    @pytest.mark.asyncio
+    async def test_insufficient_balance(self):
+        """Balance below trade value rejects the order"""
+        from core.services.risk_service import RiskService
+
+        risk = RiskService(portfolio_service=_portfolio(balance=Decimal("10")))
+        result = await risk.validate_buy_order("BTCUSDT", Decimal("0.001"), Decimal("50000"))
+
+        assert not result.approved
+        assert "Insufficient balance" in result.reason
+
+    @pytest.mark.asyncio
+    async def test_position_limit(self):
+        """Existing position plus new quantity may not exceed position limit"""
+        from core.services.risk_service import RiskService
+
+        position = PositionData(symbol="BTCUSDT", quantity=Decimal("0.02"),
+                                avg_price=Decimal("50000"), unrealized_pnl=Decimal("0"))
+        risk = RiskService(max_position_size=Decimal("1000"),
+                           portfolio_service=_portfolio(position=position))
+        result = await risk.validate_buy_order("BTCUSDT", Decimal("0.001"), Decimal("50000"))
+
+        assert not result.approved
+        assert result.risk_score == Decimal("0.8")
+
+    @pytest.mark.asyncio
+    async def test_daily_loss_rejects_before_portfolio_io(self):
+        """Exceeded daily loss rejects without touching the portfolio"""
+        from core.services.risk_service import RiskService
+
+        portfolio = _portfolio()
+        risk = RiskService(max_daily_loss=Decimal("10"), portfolio_service=portfolio)
+        risk.update_daily_loss(Decimal("11"))
+        result = await risk.validate_buy_order("BTCUSDT", Decimal("0.001"), Decimal("50000"))
+
+        assert not result.approved
+        assert result.risk_score == Decimal("0.9")
+        portfolio.get_snapshot.assert_not_awaited()
+
+    def test_limits_can_be_reconfigured(self):
+        """Decimal limit attributes remain assignable at runtime"""
+        from core.services.risk_service import RiskService
+
+        risk = RiskService()
+        risk.max_trade_size = Decimal("250.5")
+
+        assert risk.max_trade_size == Decimal("250.5")
+
+
+class TestRiskServiceSell:
+    """Test sell order validation and daily loss tracking"""
+
+    @pytest.mark.asyncio
+    async def test_sell_loss_exceeding_daily_limit(self):
+        """Sell that would push daily loss past limit is rejected"""
+        from core.services.risk_service import RiskService
+
+        position = PositionData(symbol="BTCUSDT", quantity=Decimal("1"),
+                                avg_price=Decimal("50000"), unrealized_pnl=Decimal("0"))
+        risk = RiskService(max_daily_loss=Decimal("500"),
+                           portfolio_service=_portfolio(position=position))
+        risk.update_daily_loss(Decimal("200"))
+        result = await risk.validate_sell_order("BTCUSDT", Decimal("49600"))
+
+        assert not result.approved
+        assert result.risk_score == Decimal("0.9")
+
+    @pytest.mark.asyncio
+    async def test_sell_with_profit(self):
+        """Profitable sell is approved with low risk"""
+        from core.services.risk_service import RiskService
+
+        position = PositionData(symbol="BTCUSDT", quantity=Decimal("1"),
+                                avg_price=Decimal("50000"), unrealized_pnl=Decimal("0"))
+        risk = RiskService(portfolio_service=_portfolio(position=position))
+        result = await risk.validate_sell_order("BTCUSDT", Decimal("51000"))
+
+        assert result.approved
+        assert result.risk_score == Decimal("0.1")
+
+    def test_daily_loss_tracking(self):
+        """Daily loss accumulates positive amounts and resets"""
+        from core.services.risk_service import RiskService
+
+        risk = RiskService()
+        risk.update_daily_loss(Decimal("1.5"))
+        risk.update_daily_loss(Decimal("-3"))
+        risk.update_daily_loss(Decimal("0.25"))
+        assert risk.daily_loss == Decimal("1.75")
+
+        risk.reset_daily_loss()
+        assert risk.daily_loss == Decimal("0")
@@ -0,0 +1,82 @@
+# tests/test_trading_engine.py
+"""
+Tests for TradingEngine orchestration.
+"""
+import asyncio
+import pytest
+from decimal import Decimal
+from unittest.mock import AsyncMock, Mock
+
+from core.interfaces.trading_interfaces import (
+    OrderResult, OrderStatus, PositionData, RiskCheckResult
+)
+
+
+def _engine():
+    from core.trading_engine import TradingEngine
+
+    risk = Mock()
+    risk.validate_buy_order = AsyncMock(return_value=RiskCheckResult(True, "ok"))
+    risk.validate_sell_order = AsyncMock(return_value=RiskCheckResult(True, "ok"))
+
+    orders = AsyncMock()
+    orders.execute_buy_order.return_value = OrderResult(
+        OrderStatus.SUCCESS, "1", Decimal("50000"), Decimal("0.001"), "ok")
+    orders.execute_sell_order.return_value = OrderResult(
+        OrderStatus.SUCCESS, "2", Decimal("49000"), Decimal("0.001"), "ok")
+
+    market_data = AsyncMock()
+    market_data.get_current_price.return_value = Decimal("49000")
+
+    portfolio = AsyncMock()
+    portfolio.get_position.return_value = PositionData(
+        "BTCUSDT", Decimal("0.001"), Decimal("50000"), Decimal("0"))
+
+    return TradingEngine(market_data, risk, orders, AsyncMock(), portfolio)
+
+
+class TestTradingEngineNotifications:
+    """Test notifications run off the trade path"""
+
+    @pytest.mark.asyncio
+    async def test_buy_does_not_wait_for_notification(self):
+        """Trade alert is sent in background and drained on stop"""
+        engine = _engine()
+        sent = asyncio.Event()
+
+        async def slow_alert(*args):
+            await asyncio.sleep(0.05)
+            sent.set()
+            return True
+
+        engine.notifications.send_trade_alert.side_effect = slow_alert
+
+        assert await engine.execute_buy_signal("BTCUSDT", Decimal("0.001"), Decimal("50000"))
+        assert not sent.is_set()
+
+        await engine.stop()
+        assert sent.is_set()
+        assert not engine._pending_notifications
+
+    @pytest.mark.asyncio
+    async def test_sell_records_loss(self):
+        """Losing sell updates daily loss with Decimal P&L"""
+        engine = _engine()
+
+        assert await engine.execute_sell_signal("BTCUSDT")
+        await engine.stop()
+
+        engine.risk_service.update_daily_loss.assert_called_once_with(Decimal("1.000"))
+
+
+class TestTradingEnginePortfolioStatus:
+    """Test portfolio status reporting"""
+
+    @pytest.mark.asyncio
+    async def test_portfolio_status_failure_raises(self):
+        """Portfolio status errors reach the caller"""
+        engine = _engine()
+        engine.portfolio.get_account_balance.side_effect = RuntimeError("API down")
+
+        with pytest.raises(RuntimeError):
+            await engine.get_portfolio_status()
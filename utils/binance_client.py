@@ -19,7 +19,8 @@ logger = get_trading_logger()
 class BinanceClient:
     """Async Binance client with rate limiting and error handling"""
 
-    def __init__(self, api_key: str, api_secret: str, testnet: bool = False, rate_limit_per_minute: int = 1200):
+    def __init__(self, api_key: str, api_secret: str, testnet: bool = False, rate_limit_per_minute: int = 1200,
+                 session: Optional[aiohttp.ClientSession] = None):
         self.api_key = api_key
         self.api_secret = api_secret
         self.testnet = testnet
@@ -28,7 +29,9 @@ class BinanceClient:
         # Rate limiting
         self.rate_limit = asyncio.Semaphore(
             rate_limit_per_minute // 60)  # Per second
-        self.session: Optional[aiohttp.ClientSession] = None
+        # A session passed in is shared with other clients and closed by its owner
+        self.session: Optional[aiohttp.ClientSession] = session
+        self._owns_session = session is None
 
         logger.info(f"BinanceClient initialized (testnet: {testnet})")
 
@@ -36,6 +39,7 @@ class BinanceClient:
         """Get or create HTTP session"""
         if self.session is None or self.session.closed:
             self.session = aiohttp.ClientSession()
+            self._owns_session = True
         return self.session
 
     def _generate_signature(self, params: Dict[str, Any]) -> str:
@@ -148,7 +152,7 @@ class BinanceClient:
 
     async def close(self):
         """Close HTTP session"""
-        if self.session and not self.session.closed:
+        if self._owns_session and self.session and not self.session.closed:
             await self.session.close()
             logger.info("BinanceClient session closed")
 
@@ -0,0 +1,19 @@
+# utils/decimal_utils.py
+"""
+Decimal helpers for parsing exchange values.
+Binance returns amounts as strings that repeat a lot between calls
+(unchanged balances, stable prices), so parsed values are memoized.
+"""
+from decimal import Decimal
+from functools import lru_cache
+
+
+@lru_cache(maxsize=8192)
+def _parse_decimal(text: str) -> Decimal:
+    """Parse string to Decimal (cached, Decimal is immutable so sharing is safe)"""
+    return Decimal(text)
+
+
+def to_decimal(value) -> Decimal:
+    """Convert exchange value (str or number) to Decimal, same as Decimal(str(value))"""
+    return _parse_decimal(value if isinstance(value, str) else str(value))
@@ -0,0 +1,20 @@
+# utils/jit.py
+"""
+Optional Numba JIT support.
+Numeric kernels are decorated with `njit`; when numba is not installed the
+decorator is a no-op and kernels run as plain Python/NumPy code.
+"""
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:  # numba is optional
+    NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):
+        """Fallback for numba.njit - returns the function unchanged"""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+
+        def decorator(func):
+            return func
+        return decorator
@@ -13,6 +13,11 @@ import asyncio
 from datetime import datetime
 import json
 
+try:
+    import orjson
+except ImportError:  # orjson is optional, fall back to stdlib json
+    orjson = None
+
 from config.settings import settings
 
 
@@ -204,16 +209,23 @@ def get_telegram_logger() -> logging.Logger:
 
 
 # Utility functions for structured logging
+def _dumps(data) -> str:
+    """Serialize log context to JSON (orjson when available)"""
+    if orjson is not None:
+        return orjson.dumps(data, default=str, option=orjson.OPT_NON_STR_KEYS).decode()
+    return json.dumps(data, default=str)
+
+
 def log_trade_event(logger: logging.Logger, symbol: str, event: str, **kwargs):
     """Log trading event with structured data"""
     extra = {'symbol': symbol}
-    data = json.dumps(kwargs, default=str)
+    data = _dumps(kwargs)
     logger.info(f"{event}: {data}", extra=extra)
 
 
 def log_error_with_context(logger: logging.Logger, error: Exception, context: dict):
     """Log error with full context information"""
-    context_data = json.dumps(context, default=str)
+    context_data = _dumps(context)
     logger.error(
         f"Error: {str(error)} | Context: {context_data}", exc_info=True)
 